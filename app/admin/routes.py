@@ -586,6 +586,7 @@ def edit_user(id):
                 user.publications.append(pub)
 
         db.session.commit()
+        user.invalidate_access_cache()
         flash('User updated successfully!', 'success')
         return redirect(url_for('admin.users'))
 
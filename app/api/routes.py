@@ -1,7 +1,11 @@
-from flask import request, jsonify, current_app, g
+from flask import Response, request, jsonify, current_app, g
 from functools import wraps
+import hashlib
 from datetime import datetime, timedelta
+import orjson
+from sqlalchemy.orm import load_only
 from app import db
+from app.cache import cache_get, cache_set, cache_delete
 from app.models import NewsContent, NewsSource, Publication, WorkflowRun, ContentVersion, VersionAudit, PatchedVersion, CandidateArticle
 from app.api import bp
 
@@ -70,6 +74,31 @@ def validate_publication_access(publication_id):
     return True, None
 
 
+def get_authorized_publication(publication_id, *columns):
+    """
+    Validates access to a publication and loads it in a single step.
+    Returns (publication, error_response)
+
+    Publication-specific keys reuse the publication loaded during authentication.
+    Otherwise the publication is fetched once, restricted to ``columns`` when given.
+    """
+    is_valid, error_response = validate_publication_access(publication_id)
+    if not is_valid:
+        return None, error_response
+
+    publication = g.get('authenticated_publication')
+    if publication is None:
+        query = Publication.query
+        if columns:
+            query = query.options(load_only(*columns))
+        publication = query.get(publication_id)
+
+    if not publication:
+        return None, (jsonify({'error': 'Publication not found'}), 404)
+
+    return publication, None
+
+
 @bp.route('/news', methods=['POST'])
 @require_api_key
 def create_news():
@@ -158,14 +187,10 @@ def create_news():
         return jsonify({'error': 'publication_id must be a valid integer'}), 400
 
     # Validate API key has access to this publication
-    is_valid, error_response = validate_publication_access(publication_id)
-    if not is_valid:
+    publication, error_response = get_authorized_publication(publication_id, Publication.id)
+    if error_response:
         return error_response
 
-    publication = Publication.query.get(publication_id)
-    if not publication:
-        return jsonify({'error': 'Publication not found'}), 404
-
     # Check for title
     if not data.get('title'):
         return jsonify({'error': 'Missing required field: title'}), 400
@@ -264,6 +289,7 @@ def create_news():
             content.selected_version_id = best_version.id
 
         db.session.commit()
+        _invalidate_recent_articles([publication_id])
 
         # Auto-reconcile: mark matching candidates as processed
         matched_candidates = _reconcile_candidates(publication_id, source_url_str, content.id)
@@ -385,6 +411,7 @@ def create_news_bulk():
 
     try:
         db.session.commit()
+        _invalidate_recent_articles({int(data[idx]['publication_id']) for idx in created})
 
         # Auto-reconcile candidates for each created item
         total_matched = []
@@ -418,14 +445,12 @@ def create_news_bulk():
 @require_api_key
 def get_news_sources(publication_id):
     # Validate API key has access to this publication
-    is_valid, error_response = validate_publication_access(publication_id)
-    if not is_valid:
+    publication, error_response = get_authorized_publication(
+        publication_id, Publication.id, Publication.industry_description
+    )
+    if error_response:
         return error_response
 
-    publication = Publication.query.get(publication_id)
-    if not publication:
-        return jsonify({'error': 'Publication not found'}), 404
-
     sources = NewsSource.query.filter_by(
         publication_id=publication_id,
         is_active=True
@@ -477,14 +502,10 @@ def get_publications():
 @require_api_key
 def get_publication(publication_id):
     # Validate API key has access to this publication
-    is_valid, error_response = validate_publication_access(publication_id)
-    if not is_valid:
+    publication, error_response = get_authorized_publication(publication_id)
+    if error_response:
         return error_response
 
-    publication = Publication.query.get(publication_id)
-    if not publication:
-        return jsonify({'error': 'Publication not found'}), 404
-
     return jsonify({
         'id': publication.id,
         'name': publication.name,
@@ -945,40 +966,65 @@ def get_recent_articles():
     elif days > 30:
         days = 30
 
-    # Calculate cutoff date
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-    # Build query
-    query = NewsContent.query.filter(NewsContent.created_at >= cutoff_date)
-
     # Filter by publication if specified
     if publication_id:
         # Validate API key has access to this publication
         is_valid, error_response = validate_publication_access(publication_id)
         if not is_valid:
             return error_response
-        query = query.filter_by(publication_id=publication_id)
     elif g.get('authenticated_publication'):
         # If using publication-specific API key, only return that publication's articles
-        query = query.filter_by(publication_id=g.authenticated_publication.id)
-
-    # Order by most recent first
-    articles = query.order_by(NewsContent.created_at.desc()).all()
-
-    return jsonify({
-        'articles': [
-            {
-                'id': article.id,
-                'title': article.title,
-                'source_url': article.source_url,
-                'source_name': article.source_name,
-                'created_at': article.created_at.isoformat() if article.created_at else None
-            }
-            for article in articles
-        ],
-        'count': len(articles),
-        'days': days
-    })
+        publication_id = g.authenticated_publication.id
+
+    # Serve from the short-lived cache when possible (n8n polls this endpoint)
+    cache_key = _recent_articles_cache_key(publication_id, days)
+    payload = cache_get(cache_key)
+
+    if payload is None:
+        # Calculate cutoff date
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+
+        # Build query
+        query = NewsContent.query.filter(NewsContent.created_at >= cutoff_date)
+        if publication_id:
+            query = query.filter_by(publication_id=publication_id)
+
+        # Order by most recent first
+        articles = query.order_by(NewsContent.created_at.desc()).all()
+
+        payload = current_app.json.dumps({
+            'articles': [
+                {
+                    'id': article.id,
+                    'title': article.title,
+                    'source_url': article.source_url,
+                    'source_name': article.source_name,
+                    'created_at': article.created_at.isoformat() if article.created_at else None
+                }
+                for article in articles
+            ],
+            'count': len(articles),
+            'days': days
+        }).encode('utf-8')
+        cache_set(cache_key, payload, current_app.config.get('RECENT_ARTICLES_CACHE_TTL', 30))
+
+    response = current_app.response_class(payload, mimetype='application/json')
+    response.set_etag(hashlib.blake2b(payload, digest_size=8).hexdigest())
+    return response.make_conditional(request)
+
+
+def _recent_articles_cache_key(publication_id, days):
+    return f"recent:{publication_id or 'all'}:{days}"
+
+
+def _invalidate_recent_articles(publication_ids):
+    """Drop cached /recent-articles responses affected by new content."""
+    keys = []
+    for days in range(1, 31):
+        keys.append(_recent_articles_cache_key(None, days))
+        for publication_id in publication_ids:
+            keys.append(_recent_articles_cache_key(publication_id, days))
+    cache_delete(*keys)
 
 
 @bp.route('/candidates/<int:publication_id>', methods=['GET'])
@@ -994,14 +1040,12 @@ def get_candidates(publication_id):
     - limit: max results (default: 20, max: 100)
     - source_id: filter by news source
     """
-    is_valid, error_response = validate_publication_access(publication_id)
-    if not is_valid:
+    publication, error_response = get_authorized_publication(
+        publication_id, Publication.id, Publication.require_candidate_review
+    )
+    if error_response:
         return error_response
 
-    publication = Publication.query.get(publication_id)
-    if not publication:
-        return jsonify({'error': 'Publication not found'}), 404
-
     # Default status depends on curation mode
     default_status = 'selected' if publication.require_candidate_review else 'new'
     status = request.args.get('status', default_status)
@@ -1022,39 +1066,50 @@ def get_candidates(publication_id):
         CandidateArticle.relevance_score.desc()
     ).limit(limit).all()
 
-    return jsonify({
-        'candidates': [
-            {
-                'id': c.id,
-                'url': c.url,
-                'title': c.title,
-                'snippet': c.snippet,
-                'author': c.author,
-                'published_date': c.published_date.isoformat() if c.published_date else None,
-                'relevance_score': c.relevance_score,
-                'keyword_score': c.keyword_score,
-                'recency_score': c.recency_score,
-                'source_weight': c.source_weight,
-                'status': c.status,
-                'triage_verdict': (c.extra_metadata or {}).get('triage_verdict'),
-                'triage_reasoning': (c.extra_metadata or {}).get('triage_reasoning'),
-                'content_source': (c.extra_metadata or {}).get('content_source'),
-                'source': {
-                    'id': c.news_source.id,
-                    'name': c.news_source.name,
-                    'type': c.news_source.source_type,
-                } if c.news_source else None,
-                'metadata': c.extra_metadata,
-                'discovered_at': c.discovered_at.isoformat() if c.discovered_at else None,
-            }
-            for c in candidates
-        ],
+    return orjson_response({
+        'candidates': [_candidate_json(c) for c in candidates],
         'count': len(candidates),
         'publication_id': publication_id,
         'require_candidate_review': publication.require_candidate_review,
     })
 
 
+def orjson_response(obj):
+    """JSON response serialized with orjson.
+
+    Naive datetimes come out in the same ISO format as ``isoformat()``.
+    """
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+
+def _candidate_json(c):
+    metadata = c.extra_metadata or {}
+    source = c.news_source
+    return {
+        'id': c.id,
+        'url': c.url,
+        'title': c.title,
+        'snippet': c.snippet,
+        'author': c.author,
+        'published_date': c.published_date,
+        'relevance_score': c.relevance_score,
+        'keyword_score': c.keyword_score,
+        'recency_score': c.recency_score,
+        'source_weight': c.source_weight,
+        'status': c.status,
+        'triage_verdict': metadata.get('triage_verdict'),
+        'triage_reasoning': metadata.get('triage_reasoning'),
+        'content_source': metadata.get('content_source'),
+        'source': {
+            'id': source.id,
+            'name': source.name,
+            'type': source.source_type,
+        } if source else None,
+        'metadata': c.extra_metadata,
+        'discovered_at': c.discovered_at,
+    }
+
+
 @bp.route('/candidates/<int:candidate_id>/status', methods=['POST'])
 @require_api_key
 def update_candidate_status(candidate_id):
@@ -1104,6 +1159,8 @@ def bulk_update_candidate_status():
     results = []
     errors = []
 
+    # Validate the payload first, then load every referenced candidate in one query
+    pending = []
     for idx, update in enumerate(updates):
         cid = update.get('id')
         new_status = update.get('status')
@@ -1116,22 +1173,42 @@ def bulk_update_candidate_status():
             errors.append({'index': idx, 'error': f'Invalid status: {new_status}'})
             continue
 
-        candidate = CandidateArticle.query.get(cid)
-        if not candidate:
-            errors.append({'index': idx, 'error': f'Candidate {cid} not found'})
+        try:
+            cid = int(cid)
+        except (ValueError, TypeError):
+            errors.append({'index': idx, 'error': f'Invalid id: {cid}'})
             continue
 
-        is_valid, _ = validate_publication_access(candidate.publication_id)
-        if not is_valid:
-            errors.append({'index': idx, 'error': f'Access denied for candidate {cid}'})
-            continue
+        pending.append((idx, cid, new_status, update.get('news_content_id')))
 
-        candidate.status = new_status
-        if update.get('news_content_id'):
-            candidate.news_content_id = int(update['news_content_id'])
-        results.append(cid)
+    candidates = {}
+    if pending:
+        candidates = {
+            c.id: c for c in CandidateArticle.query.filter(
+                CandidateArticle.id.in_({cid for _, cid, _, _ in pending})
+            ).all()
+        }
 
     try:
+        # Apply every mutation inside one SAVEPOINT and flush once, so a failure
+        # midway leaves nothing half-applied in the session
+        with db.session.begin_nested():
+            for idx, cid, new_status, news_content_id in pending:
+                candidate = candidates.get(cid)
+                if not candidate:
+                    errors.append({'index': idx, 'error': f'Candidate {cid} not found'})
+                    continue
+
+                is_valid, _ = validate_publication_access(candidate.publication_id)
+                if not is_valid:
+                    errors.append({'index': idx, 'error': f'Access denied for candidate {cid}'})
+                    continue
+
+                candidate.status = new_status
+                if news_content_id:
+                    candidate.news_content_id = int(news_content_id)
+                results.append(cid)
+            db.session.flush()
         db.session.commit()
     except Exception as e:
         db.session.rollback()
@@ -1148,14 +1225,10 @@ def bulk_update_candidate_status():
 @require_api_key
 def trigger_research(publication_id):
     """Manual research trigger via API."""
-    is_valid, error_response = validate_publication_access(publication_id)
-    if not is_valid:
+    publication, error_response = get_authorized_publication(publication_id, Publication.id)
+    if error_response:
         return error_response
 
-    publication = Publication.query.get(publication_id)
-    if not publication:
-        return jsonify({'error': 'Publication not found'}), 404
-
     from app.tasks import research_publication_sources
     research_publication_sources.delay(publication_id)
 
@@ -0,0 +1,52 @@
+"""Short-lived Redis cache for read-heavy API responses.
+
+Redis is treated as optional: connection or command errors are logged and
+behave like a cache miss, so callers always fall back to the database.
+"""
+import logging
+
+import redis
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def get_redis():
+    """Return a shared Redis client for the configured REDIS_URL."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            current_app.config['REDIS_URL'],
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+    return _client
+
+
+def cache_get(key):
+    """Return cached bytes for ``key``, or None on miss/error."""
+    try:
+        return get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache get failed for {key}: {e}")
+        return None
+
+
+def cache_set(key, value, ttl):
+    """Store ``value`` under ``key`` for ``ttl`` seconds. Never raises."""
+    try:
+        get_redis().set(key, value, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Cache set failed for {key}: {e}")
+
+
+def cache_delete(*keys):
+    """Delete one or more keys. Never raises."""
+    if not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Cache delete failed for {len(keys)} key(s): {e}")
@@ -1,5 +1,10 @@
 import click
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app import db
+from app.concurrency import run_in_app_context
 from app.models import User, Role, Publication, NewsSource, CandidateArticle
 
 
@@ -10,21 +15,8 @@ def register_commands(app):
     @click.option('--password', default='admin123', help='Admin password')
     def create_admin(username, email, password):
         """Create an admin user."""
-        # Create admin role if it doesn't exist
-        admin_role = Role.query.filter_by(name='admin').first()
-        if not admin_role:
-            admin_role = Role(name='admin', description='Administrator with full access')
-            db.session.add(admin_role)
-            click.echo('Created admin role')
-
-        # Create editor role if it doesn't exist
-        editor_role = Role.query.filter_by(name='editor').first()
-        if not editor_role:
-            editor_role = Role(name='editor', description='Editor can manage content')
-            db.session.add(editor_role)
-            click.echo('Created editor role')
-
-        db.session.commit()
+        roles = _ensure_default_roles()
+        admin_role = roles['admin']
 
         # Check if user already exists
         existing_user = User.query.filter_by(username=username).first()
@@ -49,21 +41,7 @@ def register_commands(app):
     @app.cli.command()
     def init_db():
         """Initialize the database with roles."""
-        # Create admin role
-        admin_role = Role.query.filter_by(name='admin').first()
-        if not admin_role:
-            admin_role = Role(name='admin', description='Administrator with full access')
-            db.session.add(admin_role)
-            click.echo('Created admin role')
-
-        # Create editor role
-        editor_role = Role.query.filter_by(name='editor').first()
-        if not editor_role:
-            editor_role = Role(name='editor', description='Editor can manage content')
-            db.session.add(editor_role)
-            click.echo('Created editor role')
-
-        db.session.commit()
+        _ensure_default_roles()
         click.echo('Database initialized with roles!')
 
     @app.cli.command()
@@ -86,7 +64,8 @@ def register_commands(app):
     @click.option('--cleanup', is_flag=True, help='Delete previously saved test-triage candidates')
     @click.option('--count', default=2, help='Number of items to sample per source type')
     @click.option('--live', is_flag=True, help='Scrape live items from sources (instead of sampling DB)')
-    def test_triage(publication_id, save, cleanup, count, live):
+    @click.option('--concurrency', default=8, help='Number of sources to scrape in parallel with --live')
+    def test_triage(publication_id, save, cleanup, count, live, concurrency):
         """Test LLM triage with sample items per source type.
 
         By default samples existing candidates from the DB. Use --live to
@@ -130,6 +109,7 @@ def register_commands(app):
                 publication_id=publication_id, is_active=True
             ).all()
 
+            pairs = []
             for source in sources:
                 if source.source_type not in triageable_types:
                     continue
@@ -139,45 +119,73 @@ def register_commands(app):
                 scraper = get_scraper(source.source_type)
                 if not scraper:
                     continue
-
-                try:
+                pairs.append((source, scraper))
+
+            # Scrapers are network-bound, so run them concurrently. Results are
+            # consumed here in source order, keeping output and DB access on
+            # the main thread.
+            app = current_app._get_current_object()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                futures = []
+                for source, scraper in pairs:
                     click.echo(f'  [{source.source_type}] Scraping {source.name}...')
-                    items = scraper.scrape(source)
-                    if not items:
-                        click.echo(f'  [{source.source_type}] No items returned')
+                    futures.append((source, pool.submit(run_in_app_context, app, scraper.scrape, source)))
+
+                for source, future in futures:
+                    try:
+                        items = future.result()
+                        if not items:
+                            click.echo(f'  [{source.source_type}] No items returned')
+                            continue
+
+                        # Take up to `count` items with titles
+                        picked = 0
+                        for item in items:
+                            if picked >= count:
+                                break
+                            sample_items.append(item)
+                            sample_source_types.append(source.source_type)
+                            sample_source_ids.append(source.id)
+                            title_preview = (item.title or item.url)[:70]
+                            click.echo(f'    -> {title_preview}')
+                            picked += 1
+
+                    except Exception as e:
+                        click.echo(f'  [{source.source_type}] Scraper error: {e}')
                         continue
-
-                    # Take up to `count` items with titles
-                    picked = 0
-                    for item in items:
-                        if picked >= count:
-                            break
-                        sample_items.append(item)
-                        sample_source_types.append(source.source_type)
-                        sample_source_ids.append(source.id)
-                        title_preview = (item.title or item.url)[:70]
-                        click.echo(f'    -> {title_preview}')
-                        picked += 1
-
-                except Exception as e:
-                    click.echo(f'  [{source.source_type}] Scraper error: {e}')
-                    continue
         else:
-            # Sample from existing candidates in DB
-            for source_type in triageable_types:
-                candidates = (
-                    CandidateArticle.query
-                    .join(NewsSource)
-                    .filter(
-                        CandidateArticle.publication_id == publication_id,
-                        NewsSource.source_type == source_type,
-                        CandidateArticle.title.isnot(None),
-                    )
-                    .order_by(CandidateArticle.discovered_at.desc())
-                    .limit(count)
-                    .all()
+            # Sample the newest `count` candidates per source type in one query
+            # (row_number() partitioned by source_type) instead of one per type.
+            ranked = (
+                db.session.query(
+                    CandidateArticle.id.label('candidate_id'),
+                    NewsSource.source_type.label('source_type'),
+                    func.row_number().over(
+                        partition_by=NewsSource.source_type,
+                        order_by=CandidateArticle.discovered_at.desc(),
+                    ).label('rn'),
+                )
+                .join(NewsSource, CandidateArticle.news_source_id == NewsSource.id)
+                .filter(
+                    CandidateArticle.publication_id == publication_id,
+                    NewsSource.source_type.in_(triageable_types),
+                    CandidateArticle.title.isnot(None),
                 )
+                .subquery()
+            )
+            rows = (
+                db.session.query(CandidateArticle, ranked.c.source_type)
+                .join(ranked, CandidateArticle.id == ranked.c.candidate_id)
+                .filter(ranked.c.rn <= count)
+                .order_by(ranked.c.rn)
+                .all()
+            )
+            candidates_by_type = {}
+            for c, source_type in rows:
+                candidates_by_type.setdefault(source_type, []).append(c)
 
+            for source_type in triageable_types:
+                candidates = candidates_by_type.get(source_type)
                 if not candidates:
                     click.echo(f'  [{source_type}] No existing candidates, skipping (try --live)')
                     continue
@@ -262,15 +270,37 @@ def register_commands(app):
             click.echo(f'Run "flask test-triage {publication_id} --cleanup" to remove them')
 
 
+DEFAULT_ROLES = [
+    {'name': 'admin', 'description': 'Administrator with full access'},
+    {'name': 'editor', 'description': 'Editor can manage content'},
+]
+
+
+def _ensure_default_roles():
+    """Create the admin/editor roles if missing and return them keyed by name.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING so it is a single idempotent
+    statement, safe to run concurrently.
+    """
+    stmt = (
+        pg_insert(Role)
+        .values(DEFAULT_ROLES)
+        .on_conflict_do_nothing(index_elements=['name'])
+        .returning(Role.name)
+    )
+    for name in db.session.execute(stmt).scalars():
+        click.echo(f'Created {name} role')
+    db.session.commit()
+
+    names = [r['name'] for r in DEFAULT_ROLES]
+    return {r.name: r for r in Role.query.filter(Role.name.in_(names)).all()}
+
+
 def _cleanup_test_candidates(publication_id):
     """Delete test-triage candidates for a publication."""
-    candidates = CandidateArticle.query.filter(
+    count = CandidateArticle.query.filter(
         CandidateArticle.publication_id == publication_id,
         CandidateArticle.title.like('[TRIAGE TEST]%'),
-    ).all()
-
-    count = len(candidates)
-    for c in candidates:
-        db.session.delete(c)
+    ).delete(synchronize_session=False)
     db.session.commit()
-    return count
\ No newline at end of file
+    return count
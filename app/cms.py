@@ -0,0 +1,162 @@
+"""Client for pushing content to a publication's CMS.
+
+Each CMS host gets a small circuit breaker: after several consecutive
+failures, pushes to that host fail fast for a cool-down period. Without it,
+every push would block a worker for the full request timeout.
+"""
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import orjson
+import requests
+
+from app.http_client import HTTP, read_capped
+
+logger = logging.getLogger(__name__)
+
+CMS_TIMEOUT = 30
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 60
+MAX_RESPONSE_BYTES = 1024 * 1024
+# Undelivered pushes are retried with 2**n second backoff (see push_content_to_cms)
+PUSH_MAX_RETRIES = 6
+
+# host -> {'failures': int, 'opened_at': float | None}
+_breakers = {}
+_lock = threading.Lock()
+
+
+class CMSError(Exception):
+    """Raised when a CMS push is refused before or after the HTTP call."""
+
+
+class CMSUnavailableError(CMSError):
+    pass
+
+
+class CMSResponseTooLargeError(CMSError):
+    pass
+
+
+class CMSResponseReadError(CMSError):
+    pass
+
+
+def post_to_cms(url, payload, headers):
+    """POST ``payload`` to the CMS and return ``(response, body)``.
+
+    The body is read here, capped at MAX_RESPONSE_BYTES; don't read it
+    from the response again.
+
+    Raises:
+        CMSUnavailableError: The circuit for this host is open
+        CMSResponseTooLargeError: The response body is over MAX_RESPONSE_BYTES
+        CMSResponseReadError: The request was sent but reading the response failed
+        requests.exceptions.RequestException: On network errors
+    """
+    host = urlparse(url).netloc
+    _before_call(host)
+
+    try:
+        response = HTTP.post(url, data=orjson.dumps(payload), headers=headers, timeout=CMS_TIMEOUT, stream=True)
+    except requests.exceptions.RequestException:
+        _record_failure(host)
+        raise
+
+    if response.status_code >= 500:
+        _record_failure(host)
+    else:
+        _record_success(host)
+
+    # Bail if the CMS sends something pathological, declared or not. The
+    # POST has been delivered by now, so read errors aren't surfaced as
+    # requests errors a caller might retry on.
+    try:
+        with response:
+            body = read_capped(response, MAX_RESPONSE_BYTES)
+    except requests.exceptions.RequestException as e:
+        raise CMSResponseReadError(f'Failed reading CMS response from {host}: {e}') from e
+    if body is None:
+        raise CMSResponseTooLargeError(
+            f'CMS response from {host} is over {MAX_RESPONSE_BYTES} bytes'
+        )
+
+    return response, body
+
+
+def push_retry_window():
+    """Worst-case seconds between queuing a push and its final outcome.
+
+    Every attempt may run to CMS_TIMEOUT, plus the backoff between them and
+    some slack for the queue. The UI polls at least this long.
+    """
+    backoff = sum(2 ** n for n in range(PUSH_MAX_RETRIES))
+    return backoff + (PUSH_MAX_RETRIES + 1) * CMS_TIMEOUT + 30
+
+
+def build_cms_payload(title, body, deck=None, teaser=None):
+    """Build the CMS command payload for a NEWS post."""
+    # CMS API props: title, type, body, deck, excerpt, byline, creditOrSource, notes, slug
+    props = {
+        'title': title,
+        'type': 'NEWS',
+        'body': body
+    }
+
+    # Add optional fields if they exist
+    if deck:
+        props['deck'] = deck
+    if teaser:
+        props['excerpt'] = teaser  # CMS calls it 'excerpt', not 'teaser'
+
+    return {
+        'command': {
+            'input': [
+                {
+                    'form': 'POST',
+                    'props': props
+                }
+            ]
+        },
+        'view': 'main'
+    }
+
+
+def cms_headers(publication):
+    """Request headers for pushing to ``publication``'s CMS."""
+    return {
+        'Authorization': publication.cms_auth_header,
+        'Content-Type': 'application/json',
+        'x-namespace': 'watt/default'
+    }
+
+
+def _before_call(host):
+    with _lock:
+        state = _breakers.get(host)
+        if not state or state['opened_at'] is None:
+            return
+        if time.monotonic() - state['opened_at'] < RESET_TIMEOUT:
+            raise CMSUnavailableError(
+                f'CMS at {host} is unavailable after {state["failures"]} consecutive failures; '
+                f'try again in a minute'
+            )
+        # Cool-down elapsed: let this call through as a trial (half-open)
+        state['opened_at'] = None
+
+
+def _record_failure(host):
+    with _lock:
+        state = _breakers.setdefault(host, {'failures': 0, 'opened_at': None})
+        state['failures'] += 1
+        if state['failures'] >= FAILURE_THRESHOLD:
+            if state['failures'] == FAILURE_THRESHOLD:
+                logger.warning(f"Opening CMS circuit for {host} after {state['failures']} failures")
+            state['opened_at'] = time.monotonic()
+
+
+def _record_success(host):
+    with _lock:
+        _breakers.pop(host, None)
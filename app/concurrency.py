@@ -0,0 +1,12 @@
+"""Helpers for running app code on worker threads."""
+
+
+def run_in_app_context(app, fn, *args, **kwargs):
+    """Call ``fn(*args, **kwargs)`` inside ``app``'s context.
+
+    Thread-pool workers don't inherit the caller's app context, and most of
+    the research code reads current_app.config. Pass the real app object
+    (``current_app._get_current_object()``), not the proxy.
+    """
+    with app.app_context():
+        return fn(*args, **kwargs)
@@ -0,0 +1,58 @@
+"""Shared HTTP sessions for outbound calls (CMS, n8n, scrapers), Firecrawl and Anthropic.
+
+Reusing one pooled session keeps TCP/TLS connections to the same few hosts
+alive between requests instead of handshaking on every call.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# urllib3 only retries idempotent methods by default, so POSTs (CMS pushes,
+# workflow triggers) are never sent twice.
+_retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_retry)
+
+HTTP = requests.Session()
+HTTP.mount('http://', _adapter)
+HTTP.mount('https://', _adapter)
+
+# Firecrawl callers already back off on 429s and transient errors themselves,
+# so this session doesn't retry on top of them.
+_firecrawl_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+
+FIRECRAWL = requests.Session()
+FIRECRAWL.mount('https://', _firecrawl_adapter)
+
+
+def read_capped(resp, max_bytes: int) -> Optional[bytes]:
+    """Read a streamed response body, or return None once it passes max_bytes."""
+    content_length = resp.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        return None
+
+    body = bytearray()
+    for chunk in resp.iter_content(65536):
+        body += chunk
+        if len(body) > max_bytes:
+            return None
+    return bytes(body)
+
+
+@lru_cache(maxsize=4)
+def firecrawl_headers(api_key):
+    """Request headers for Firecrawl calls with ``api_key``. Shared; don't mutate."""
+    return {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json',
+    }
+
+
+@lru_cache(maxsize=4)
+def anthropic_client(api_key):
+    """Shared Anthropic client for ``api_key``, so its connection pool is reused."""
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
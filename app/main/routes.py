@@ -1,32 +1,94 @@
-from flask import render_template, request, redirect, url_for, flash, jsonify, current_app
+from flask import render_template, request, redirect, url_for, flash, jsonify, current_app, g, abort
+from functools import wraps
 from flask_login import login_required, current_user
 from datetime import datetime
-import uuid
+import base64
+import orjson
+from sqlalchemy import tuple_
+from sqlalchemy.orm import load_only, joinedload, selectinload
 from app import db
-from app.models import NewsContent, Publication, WorkflowRun, ContentVersion, VersionAudit, PatchedVersion, CandidateArticle, WeeklyBriefing, AuthorProfile, NewsSource
+from app.models import NewsContent, Publication, WorkflowRun, new_workflow_id, ContentVersion, VersionAudit, PatchedVersion, CandidateArticle, WeeklyBriefing, AuthorProfile, NewsSource
 from app.main import bp
 from app.publication_context import resolve_publication_id
+from app.http_client import HTTP
 import requests
 
 
+@bp.before_request
+def load_user_publication_ids():
+    """Resolve the current user's publication IDs once per request."""
+    g.user_pub_ids = current_user.publication_id_set if current_user.is_authenticated else frozenset()
+
+
+def require_content_access(*eager, with_version=False):
+    """Load the route's NewsContent and check the user can access it.
+
+    The view receives ``content`` (and ``version`` when ``with_version`` is
+    set) in place of the ``id``/``version_id`` URL arguments. ``eager``
+    names NewsContent relationships to load with it; with a version, both
+    rows are fetched in one query.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(id, version_id=None):
+            # Resolved per call: backrefs like NewsContent.publication only
+            # exist once the mappers are configured
+            options = []
+            for name in eager:
+                rel = getattr(NewsContent, name)
+                options.append(selectinload(rel) if rel.property.uselist else joinedload(rel))
+
+            version = None
+            if with_version:
+                row = db.session.query(NewsContent, ContentVersion).options(*options).outerjoin(
+                    ContentVersion, ContentVersion.id == version_id
+                ).filter(NewsContent.id == id).first()
+                if not row or row[1] is None:
+                    abort(404)
+                content, version = row
+
+                # Verify version belongs to this content
+                if version.content_id != content.id:
+                    return jsonify({'error': 'Version does not belong to this content'}), 400
+            else:
+                content = NewsContent.query.options(*options).get_or_404(id)
+
+            if not current_user.has_role('admin') and content.publication_id not in g.user_pub_ids:
+                return jsonify({'error': 'Access denied'}), 403
+
+            if with_version:
+                return f(content, version)
+            return f(content)
+        return decorated
+    return decorator
+
+
 @bp.route('/')
 @login_required
 def index():
     return redirect(url_for('main.dashboard'))
 
 
+# Offset-paginated lists stop counting here; the UI shows "1000+"
+PAGE_COUNT_CAP = 1000
+
 CONTENT_SORT_COLUMNS = {
     'title': NewsContent.title,
     'source': NewsContent.source_name,
     'status': NewsContent.status,
     'date': NewsContent.created_at,
 }
+# Columns rendered by the dashboard list; everything else stays unloaded
+CONTENT_LIST_COLUMNS = (
+    NewsContent.id, NewsContent.publication_id, NewsContent.title,
+    NewsContent.source_name, NewsContent.status, NewsContent.created_at,
+)
 
 
 @bp.route('/dashboard')
 @login_required
 def dashboard():
-    page = request.args.get('page', 1, type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
     status = request.args.get('status', 'staged')
     sort = request.args.get('sort', 'date')
     direction = request.args.get('direction', 'desc' if sort == 'date' else 'asc')
@@ -60,25 +122,92 @@ def dashboard():
     # Filter by selected publication
     if publication_id:
         query = query.filter_by(publication_id=publication_id)
-    elif not current_user.has_role('admin') and current_user.publications:
-        pub_ids = current_user.get_publication_ids()
-        query = query.filter(NewsContent.publication_id.in_(pub_ids))
+    elif not current_user.has_role('admin') and g.user_pub_ids:
+        query = query.filter(NewsContent.publication_id.in_(g.user_pub_ids))
 
     if status != 'all':
         query = query.filter_by(status=status)
 
-    sort_col = CONTENT_SORT_COLUMNS[sort]
-    sort_expr = sort_col.desc() if direction == 'desc' else sort_col.asc()
-    content = query.order_by(sort_expr, NewsContent.id.desc()).paginate(
-        page=page, per_page=current_app.config['ITEMS_PER_PAGE'], error_out=False
-    )
-
-    return render_template('main/dashboard.html', title='Dashboard', content=content, status=status,
+    query = query.options(load_only(*CONTENT_LIST_COLUMNS))
+    per_page = current_app.config['ITEMS_PER_PAGE']
+    page_args = dict(status=status, sort=sort, direction=direction,
+                     publication_id=current_publication.id if current_publication else None)
+    next_url = prev_url = None
+    total = page_start = None
+
+    if sort == 'date':
+        # Keyset pagination on (created_at, id): each page costs the same
+        # regardless of depth, unlike OFFSET.
+        cursor = _decode_cursor(request.args.get('after'))
+        if direction == 'desc':
+            order = (NewsContent.created_at.desc(), NewsContent.id.desc())
+        else:
+            order = (NewsContent.created_at.asc(), NewsContent.id.asc())
+        query = query.order_by(*order)
+        if cursor:
+            key = tuple_(NewsContent.created_at, NewsContent.id)
+            query = query.filter(key < cursor if direction == 'desc' else key > cursor)
+            prev_url = url_for('main.dashboard', **page_args)
+        elif page > 1:
+            # Old ?page= links still work; following "Next" switches to cursors
+            query = query.offset((page - 1) * per_page)
+            prev_url = url_for('main.dashboard', **page_args)
+
+        rows = query.limit(per_page + 1).all()
+        items = rows[:per_page]
+        if len(rows) > per_page:
+            last = items[-1]
+            next_url = url_for('main.dashboard', after=_encode_cursor(last.created_at, last.id), **page_args)
+    else:
+        sort_col = CONTENT_SORT_COLUMNS[sort]
+        sort_expr = sort_col.desc() if direction == 'desc' else sort_col.asc()
+        items, has_next, total = _fetch_page(
+            query.order_by(sort_expr, NewsContent.id.desc()), page, per_page
+        )
+        page_start = (page - 1) * per_page + 1
+        if page > 1:
+            prev_url = url_for('main.dashboard', page=page - 1, **page_args)
+        if has_next:
+            next_url = url_for('main.dashboard', page=page + 1, **page_args)
+
+    return render_template('main/dashboard.html', title='Dashboard', items=items, total=total, page_start=page_start,
+                           next_url=next_url, prev_url=prev_url, status=status,
                            sort=sort, direction=direction,
                            publications=publications, current_publication=current_publication,
                            briefing=briefing, author_profiles=author_profiles)
 
 
+def _fetch_page(query, page, per_page):
+    """Fetch one LIMIT/OFFSET page without paginate()'s unbounded COUNT(*).
+
+    Returns (items, has_next, total). The total counts at most
+    PAGE_COUNT_CAP rows and reads e.g. "1000+" beyond that.
+    """
+    rows = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+    total = query.order_by(None).limit(PAGE_COUNT_CAP + 1).count()
+    if total > PAGE_COUNT_CAP:
+        total = f'{PAGE_COUNT_CAP}+'
+    return rows[:per_page], len(rows) > per_page, total
+
+
+def _encode_cursor(created_at, content_id):
+    """Encode a (created_at, id) keyset position as an opaque URL token."""
+    raw = f'{created_at.isoformat()}|{content_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(token):
+    """Decode a token from _encode_cursor, or return None if missing/invalid."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        created_at, content_id = raw.split('|')
+        return datetime.fromisoformat(created_at), int(content_id)
+    except ValueError:
+        return None
+
+
 @bp.route('/dashboard/regenerate-briefing', methods=['POST'])
 @login_required
 def regenerate_briefing():
@@ -86,7 +215,7 @@ def regenerate_briefing():
     if not publication_id:
         return jsonify({'error': 'publication_id required'}), 400
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(publication_id):
+    if not current_user.has_role('admin') and publication_id not in g.user_pub_ids:
         return jsonify({'error': 'Access denied'}), 403
 
     from app.tasks import generate_weekly_briefings
@@ -115,7 +244,7 @@ def get_author_profiles(pub_id):
 def view_content(id):
     content = NewsContent.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
+    if not current_user.has_role('admin') and content.publication_id not in g.user_pub_ids:
         flash('Access denied', 'error')
         return redirect(url_for('main.dashboard'))
 
@@ -124,12 +253,8 @@ def view_content(id):
 
 @bp.route('/content/<int:id>/push', methods=['POST'])
 @login_required
-def push_to_cms(id):
-    content = NewsContent.query.get_or_404(id)
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
+@require_content_access('publication')
+def push_to_cms(content):
     if content.pushed_to_cms:
         return jsonify({'error': 'Content already pushed to CMS'}), 400
 
@@ -137,93 +262,14 @@ def push_to_cms(id):
     if not publication.cms_url or not publication.cms_api_key:
         return jsonify({'error': 'CMS configuration not set for this publication'}), 400
 
-    try:
-        # Build props with available fields
-        # CMS API props: title, type, body, deck, excerpt, byline, creditOrSource, notes, slug
-        props = {
-            'title': content.title,
-            'type': 'NEWS',
-            'body': content.content
-        }
-
-        # Add optional fields if they exist
-        if content.deck:
-            props['deck'] = content.deck
-        if content.teaser:
-            props['excerpt'] = content.teaser  # CMS calls it 'excerpt', not 'teaser'
-
-        payload = {
-            'command': {
-                'input': [
-                    {
-                        'form': 'POST',
-                        'props': props
-                    }
-                ]
-            },
-            'view': 'main'
-        }
-
-        # Add Bearer prefix if not already present
-        api_key = publication.cms_api_key
-        if not api_key.lower().startswith('bearer '):
-            api_key = f'Bearer {api_key}'
-
-        headers = {
-            'Authorization': api_key,
-            'Content-Type': 'application/json',
-            'x-namespace': 'watt/default'
-        }
-
-        response = requests.post(publication.cms_url, json=payload, headers=headers, timeout=30)
-
-        # Check for errors and return the actual API error message
-        if not response.ok:
-            try:
-                error_detail = response.json()
-            except Exception:
-                error_detail = response.text
-            # Include detail in error message so it shows in UI alert
-            error_msg = f'CMS API error ({response.status_code}): {error_detail}'
-            current_app.logger.error(f'CMS push failed: {error_msg}')
-            current_app.logger.error(f'Payload sent: {payload}')
-            return jsonify({
-                'error': error_msg,
-                'detail': error_detail,
-                'payload_sent': payload
-            }), 500  # Return 500 so our UI handles it
-
-        cms_response = response.json()
-        content.pushed_to_cms = True
-        content.cms_id = cms_response.get('id')
-        content.pushed_at = datetime.utcnow()
-        content.pushed_by_id = current_user.id
-        content.status = 'published'
-
-        db.session.commit()
-
-        return jsonify({'success': True, 'message': 'Content pushed to CMS successfully', 'cms_id': content.cms_id})
-
-    except requests.exceptions.RequestException as e:
-        return jsonify({'error': f'Failed to push to CMS: {str(e)}', 'type': 'request_exception'}), 500
-    except Exception as e:
-        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+    return _queue_cms_push(content)
 
 
 @bp.route('/content/<int:id>/version/<int:version_id>/push', methods=['POST'])
 @login_required
-def push_version_to_cms(id, version_id):
+@require_content_access('publication', with_version=True)
+def push_version_to_cms(content, version):
     """Push a specific version of content to CMS."""
-    content = NewsContent.query.get_or_404(id)
-    version = ContentVersion.query.get_or_404(version_id)
-
-    # Verify version belongs to this content
-    if version.content_id != content.id:
-        return jsonify({'error': 'Version does not belong to this content'}), 400
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     if version.pushed_to_cms:
         return jsonify({'error': 'This version has already been pushed to CMS'}), 400
 
@@ -231,101 +277,47 @@ def push_version_to_cms(id, version_id):
     if not publication.cms_url or not publication.cms_api_key:
         return jsonify({'error': 'CMS configuration not set for this publication'}), 400
 
-    try:
-        # Build props with available fields from version
-        # CMS API props: title, type, body, deck, excerpt, byline, creditOrSource, notes, slug
-        props = {
-            'title': content.title,
-            'type': 'NEWS',
-            'body': version.content
-        }
-
-        # Add optional fields from version if they exist
-        if version.deck:
-            props['deck'] = version.deck
-        if version.teaser:
-            props['excerpt'] = version.teaser  # CMS calls it 'excerpt', not 'teaser'
-
-        payload = {
-            'command': {
-                'input': [
-                    {
-                        'form': 'POST',
-                        'props': props
-                    }
-                ]
-            },
-            'view': 'main'
-        }
+    return _queue_cms_push(content, version)
 
-        api_key = publication.cms_api_key
-        if not api_key.lower().startswith('bearer '):
-            api_key = f'Bearer {api_key}'
 
-        headers = {
-            'Authorization': api_key,
-            'Content-Type': 'application/json',
-            'x-namespace': 'watt/default'
-        }
+def _queue_cms_push(content, version=None):
+    """Record a cms_push WorkflowRun and hand the HTTP call to Celery.
 
-        response = requests.post(publication.cms_url, json=payload, headers=headers, timeout=30)
-
-        # Check for errors and return the actual API error message
-        if not response.ok:
-            try:
-                error_detail = response.json()
-            except Exception:
-                error_detail = response.text
-            # Include detail in error message so it shows in UI alert
-            error_msg = f'CMS API error ({response.status_code}): {error_detail}'
-            current_app.logger.error(f'CMS push failed: {error_msg}')
-            current_app.logger.error(f'Payload sent: {payload}')
-            return jsonify({
-                'error': error_msg,
-                'detail': error_detail,
-                'payload_sent': payload
-            }), 500  # Return 500 so our UI handles it
-
-        cms_response = response.json()
-        version.pushed_to_cms = True
-        version.cms_id = cms_response.get('id')
-        version.pushed_at = datetime.utcnow()
-        version.pushed_by_id = current_user.id
-
-        # Update parent content status
-        content.status = 'published'
+    The CMS can take up to 30s to answer, so the request returns 202 with a
+    workflow_id the client polls via /api/workflow/<id>/status.
+    """
+    from app.cms import push_retry_window
+    from app.tasks import push_content_to_cms
 
-        db.session.commit()
+    workflow_id = new_workflow_id()
+    workflow_run = WorkflowRun(
+        id=workflow_id,
+        publication_id=content.publication_id,
+        triggered_by_id=current_user.id,
+        workflow_type='cms_push',
+        status='pending'
+    )
+    db.session.add(workflow_run)
+    db.session.commit()
 
-        return jsonify({
-            'success': True,
-            'message': f'{version.ai_provider.title()} version pushed to CMS successfully',
-            'cms_id': version.cms_id,
-            'version_id': version.id
-        })
+    push_content_to_cms.delay(workflow_id, content.id, current_user.id, version.id if version else None)
 
-    except requests.exceptions.RequestException as e:
-        return jsonify({'error': f'Failed to push to CMS: {str(e)}', 'type': 'request_exception'}), 500
-    except Exception as e:
-        return jsonify({'error': f'An error occurred: {str(e)}'}), 500
+    return jsonify({
+        'success': True,
+        'status': 'queued',
+        'workflow_id': workflow_id,
+        'poll_seconds': push_retry_window(),
+    }), 202
 
 
 @bp.route('/content/<int:id>/version/<int:version_id>/push-ghost', methods=['POST'])
 @login_required
-def push_version_to_ghost(id, version_id):
+@require_content_access('publication', with_version=True)
+def push_version_to_ghost(content, version):
     """Push a specific version of content to Ghost CMS."""
     import markdown as md
     from app.ghost import create_ghost_post
 
-    content = NewsContent.query.get_or_404(id)
-    version = ContentVersion.query.get_or_404(version_id)
-
-    if version.content_id != content.id:
-        return jsonify({'error': 'Version does not belong to this content'}), 400
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     if version.pushed_to_ghost:
         return jsonify({'error': 'This version has already been pushed to Ghost'}), 400
 
@@ -377,18 +369,9 @@ def push_version_to_ghost(id, version_id):
 
 @bp.route('/content/<int:id>/select-version/<int:version_id>', methods=['POST'])
 @login_required
-def select_version(id, version_id):
+@require_content_access(with_version=True)
+def select_version(content, version):
     """Select a specific version as the preferred version for this content."""
-    content = NewsContent.query.get_or_404(id)
-    version = ContentVersion.query.get_or_404(version_id)
-
-    # Verify version belongs to this content
-    if version.content_id != content.id:
-        return jsonify({'error': 'Version does not belong to this content'}), 400
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     content.selected_version_id = version.id
     db.session.commit()
 
@@ -401,17 +384,9 @@ def select_version(id, version_id):
 
 @bp.route('/content/<int:id>/version/<int:version_id>/edit', methods=['POST'])
 @login_required
-def edit_version(id, version_id):
+@require_content_access(with_version=True)
+def edit_version(content, version):
     """Update editable fields on a content version."""
-    content = NewsContent.query.get_or_404(id)
-    version = ContentVersion.query.get_or_404(version_id)
-
-    if version.content_id != content.id:
-        return jsonify({'error': 'Version does not belong to this content'}), 400
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     data = request.json or {}
     editable_fields = ('deck', 'teaser', 'summary', 'content', 'notes')
     updated = []
@@ -429,12 +404,8 @@ def edit_version(id, version_id):
 
 @bp.route('/content/<int:id>/status', methods=['POST'])
 @login_required
-def update_status(id):
-    content = NewsContent.query.get_or_404(id)
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
+@require_content_access()
+def update_status(content):
     new_status = request.json.get('status')
     if new_status not in ['staged', 'approved', 'rejected', 'published']:
         return jsonify({'error': 'Invalid status'}), 400
@@ -459,7 +430,7 @@ def trigger_content_workflow(id):
     publication = Publication.query.get_or_404(id)
 
     # Check access
-    if not current_user.has_role('admin') and not current_user.has_publication_access(id):
+    if not current_user.has_role('admin') and id not in g.user_pub_ids:
         flash('Access denied', 'error')
         return redirect(url_for('main.dashboard'))
 
@@ -468,21 +439,9 @@ def trigger_content_workflow(id):
         flash('Content workflow URL is not configured. Set N8N_CONTENT_WORKFLOW_URL environment variable.', 'error')
         return redirect(url_for('main.dashboard', publication_id=id))
 
-    # Create workflow run record
-    workflow_id = str(uuid.uuid4())
-    workflow_run = WorkflowRun(
-        id=workflow_id,
-        publication_id=publication.id,
-        triggered_by_id=current_user.id,
-        workflow_type='content_generation',
-        status='pending'
-    )
-    db.session.add(workflow_run)
-    db.session.commit()
-
-    try:
+    def trigger(workflow_id):
         # Fire-and-forget: use a very short timeout just to send the request
-        requests.get(
+        HTTP.get(
             workflow_url,
             params={
                 'publication_id': publication.id,
@@ -490,19 +449,11 @@ def trigger_content_workflow(id):
             },
             timeout=0.5
         )
-    except requests.exceptions.Timeout:
-        # Expected - we're not waiting for a response
-        pass
-    except requests.exceptions.RequestException as e:
-        workflow_run.status = 'failed'
-        workflow_run.message = str(e)
-        db.session.commit()
-        flash(f'Failed to trigger workflow: {str(e)}', 'error')
-        return redirect(url_for('main.dashboard', publication_id=id))
 
-    # Update status to running
-    workflow_run.status = 'running'
-    db.session.commit()
+    workflow_id, error = _start_workflow_run(publication.id, 'content_generation', trigger)
+    if error:
+        flash(f'Failed to trigger workflow: {error}', 'error')
+        return redirect(url_for('main.dashboard', publication_id=id))
 
     return redirect(url_for('main.dashboard', publication_id=id, workflow_id=workflow_id))
 
@@ -512,7 +463,7 @@ def trigger_content_workflow(id):
 def trigger_candidate_content_workflow(id):
     publication = Publication.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(id):
+    if not current_user.has_role('admin') and id not in g.user_pub_ids:
         flash('Access denied', 'error')
         return redirect(url_for('main.dashboard'))
 
@@ -521,7 +472,7 @@ def trigger_candidate_content_workflow(id):
         flash('Candidate content workflow URL is not configured. Set N8N_CANDIDATE_CONTENT_WORKFLOW_URL environment variable.', 'error')
         return redirect(url_for('main.dashboard', publication_id=id))
 
-    workflow_id = str(uuid.uuid4())
+    workflow_id = new_workflow_id()
     workflow_run = WorkflowRun(
         id=workflow_id,
         publication_id=publication.id,
@@ -545,7 +496,7 @@ def trigger_candidate_content_workflow(id):
             payload['author_style_guide'] = author.style_guide
 
     try:
-        requests.post(
+        HTTP.post(
             workflow_url,
             json=payload,
             headers={'Content-Type': 'application/json'},
@@ -572,7 +523,7 @@ def submit_url_workflow(id):
     publication = Publication.query.get_or_404(id)
 
     # Check access
-    if not current_user.has_role('admin') and not current_user.has_publication_access(id):
+    if not current_user.has_role('admin') and id not in g.user_pub_ids:
         flash('Access denied', 'error')
         return redirect(url_for('main.dashboard'))
 
@@ -587,7 +538,7 @@ def submit_url_workflow(id):
         return redirect(url_for('main.dashboard', publication_id=id))
 
     # Create workflow run record
-    workflow_id = str(uuid.uuid4())
+    workflow_id = new_workflow_id()
     workflow_run = WorkflowRun(
         id=workflow_id,
         publication_id=publication.id,
@@ -612,7 +563,7 @@ def submit_url_workflow(id):
             payload['author_style_guide'] = author.style_guide
 
     try:
-        requests.post(
+        HTTP.post(
             workflow_url,
             json=payload,
             headers={'Content-Type': 'application/json'},
@@ -637,38 +588,21 @@ def submit_url_workflow(id):
 
 @bp.route('/content/<int:id>/generate-image', methods=['POST'])
 @login_required
-def generate_image(id):
+@require_content_access('selected_version')
+def generate_image(content):
     """Trigger image generation workflow for a content item."""
-    content = NewsContent.query.get_or_404(id)
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     workflow_url = current_app.config.get('N8N_IMAGE_WORKFLOW_URL')
     if not workflow_url:
         return jsonify({'error': 'Image workflow URL is not configured. Set N8N_IMAGE_WORKFLOW_URL environment variable.'}), 400
 
-    # Create workflow run record
-    workflow_id = str(uuid.uuid4())
-    workflow_run = WorkflowRun(
-        id=workflow_id,
-        publication_id=content.publication_id,
-        triggered_by_id=current_user.id,
-        workflow_type='image_generation',
-        status='pending',
-        message=f'content_id:{content.id}'  # Store content_id for the callback
-    )
-    db.session.add(workflow_run)
-    db.session.commit()
-
-    try:
-        # Get summary from selected version or fall back to legacy fields
-        version = content.selected_version
-        if version:
-            summary = version.summary or version.teaser or version.deck or ''
-        else:
-            summary = content.summary or content.teaser or content.deck or ''
+    # Get summary from selected version or fall back to legacy fields
+    version = content.selected_version
+    if version:
+        summary = version.summary or version.teaser or version.deck or ''
+    else:
+        summary = content.summary or content.teaser or content.deck or ''
 
+    def trigger(workflow_id):
         # POST to n8n with article summary
         payload = {
             'workflow_id': workflow_id,
@@ -676,8 +610,7 @@ def generate_image(id):
             'title': content.title,
             'summary': summary
         }
-
-        response = requests.post(
+        response = HTTP.post(
             workflow_url,
             json=payload,
             headers={'Content-Type': 'application/json'},
@@ -685,18 +618,12 @@ def generate_image(id):
         )
         response.raise_for_status()
 
-    except requests.exceptions.Timeout:
-        # Timeout is acceptable for async workflows
-        pass
-    except requests.exceptions.RequestException as e:
-        workflow_run.status = 'failed'
-        workflow_run.message = str(e)
-        db.session.commit()
-        return jsonify({'error': f'Failed to trigger image workflow: {str(e)}'}), 500
-
-    # Update status to running
-    workflow_run.status = 'running'
-    db.session.commit()
+    # The run's message stores content_id for the callback
+    workflow_id, error = _start_workflow_run(
+        content.publication_id, 'image_generation', trigger, message=f'content_id:{content.id}'
+    )
+    if error:
+        return jsonify({'error': f'Failed to trigger image workflow: {error}'}), 500
 
     return jsonify({
         'success': True,
@@ -707,51 +634,19 @@ def generate_image(id):
 
 @bp.route('/content/<int:id>/audit', methods=['POST'])
 @login_required
-def trigger_audit(id):
+@require_content_access()
+def trigger_audit(content):
     """Trigger audit workflow to patch and score article versions."""
-    content = NewsContent.query.get_or_404(id)
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     # Check if there are versions to audit
-    if not content.versions:
+    versions = ContentVersion.query.filter_by(content_id=content.id)
+    if not db.session.query(versions.exists()).scalar():
         return jsonify({'error': 'No versions to audit. This article has no AI-generated versions.'}), 400
 
     workflow_url = current_app.config.get('N8N_AUDIT_WORKFLOW_URL')
     if not workflow_url:
         return jsonify({'error': 'Audit workflow URL is not configured. Set N8N_AUDIT_WORKFLOW_URL environment variable.'}), 400
 
-    # Create workflow run record
-    workflow_id = str(uuid.uuid4())
-    workflow_run = WorkflowRun(
-        id=workflow_id,
-        publication_id=content.publication_id,
-        triggered_by_id=current_user.id,
-        workflow_type='audit',
-        status='pending',
-        message=f'content_id:{content.id}'
-    )
-    db.session.add(workflow_run)
-    db.session.commit()
-
-    try:
-        # Build payload with all versions
-        versions_payload = []
-        for version in content.versions:
-            versions_payload.append({
-                'version_id': version.id,
-                'ai_provider': version.ai_provider,
-                'ai_model': version.ai_model,
-                'quality_score': version.quality_score,
-                'is_final': version.is_final,
-                'deck': version.deck,
-                'teaser': version.teaser,
-                'body': version.content,
-                'summary': version.summary,
-                'notes': version.notes
-            })
-
+    def trigger(workflow_id):
         payload = {
             'workflow_id': workflow_id,
             'article_id': content.id,
@@ -759,29 +654,23 @@ def trigger_audit(id):
             'source_url': content.source_url,
             'source_name': content.source_name,
             'keywords': content.keywords,
-            'versions': versions_payload
         }
 
-        response = requests.post(
+        # Versions carry several large text fields, so fetch them in small
+        # batches and stream the body (chunked) one version at a time
+        response = HTTP.post(
             workflow_url,
-            json=payload,
+            data=_iter_audit_payload(payload, versions.order_by(ContentVersion.id).yield_per(20)),
             headers={'Content-Type': 'application/json'},
             timeout=5
         )
         response.raise_for_status()
 
-    except requests.exceptions.Timeout:
-        # Timeout is acceptable for async workflows
-        pass
-    except requests.exceptions.RequestException as e:
-        workflow_run.status = 'failed'
-        workflow_run.message = str(e)
-        db.session.commit()
-        return jsonify({'error': f'Failed to trigger audit workflow: {str(e)}'}), 500
-
-    # Update status to running
-    workflow_run.status = 'running'
-    db.session.commit()
+    workflow_id, error = _start_workflow_run(
+        content.publication_id, 'audit', trigger, message=f'content_id:{content.id}'
+    )
+    if error:
+        return jsonify({'error': f'Failed to trigger audit workflow: {error}'}), 500
 
     return jsonify({
         'success': True,
@@ -790,20 +679,71 @@ def trigger_audit(id):
     })
 
 
+def _start_workflow_run(publication_id, workflow_type, trigger, message=None):
+    """Record a running WorkflowRun, then call ``trigger(workflow_id)`` to start n8n.
+
+    A timeout from ``trigger`` is fine (n8n runs asynchronously); any other
+    request error marks the run failed. Returns ``(workflow_id, error)``,
+    where ``error`` is None on success.
+    """
+    workflow_id = new_workflow_id()
+    workflow_run = WorkflowRun(
+        id=workflow_id,
+        publication_id=publication_id,
+        triggered_by_id=current_user.id,
+        workflow_type=workflow_type,
+        status='running',
+        message=message
+    )
+    # Single commit before calling n8n, so its completion callback can find the run
+    db.session.add(workflow_run)
+    db.session.commit()
+
+    try:
+        trigger(workflow_id)
+    except requests.exceptions.Timeout:
+        # Expected for async workflows - we're not waiting for a response
+        pass
+    except requests.exceptions.RequestException as e:
+        workflow_run.status = 'failed'
+        workflow_run.message = str(e)
+        db.session.commit()
+        return workflow_id, str(e)
+
+    return workflow_id, None
+
+
+def _iter_audit_payload(payload, versions):
+    """Yield ``payload`` plus a "versions" array as encoded JSON chunks."""
+    head = orjson.dumps(payload)
+    yield head[:-1] + b', "versions": ['
+    for i, version in enumerate(versions):
+        chunk = orjson.dumps({
+            'version_id': version.id,
+            'ai_provider': version.ai_provider,
+            'ai_model': version.ai_model,
+            'quality_score': version.quality_score,
+            'is_final': version.is_final,
+            'deck': version.deck,
+            'teaser': version.teaser,
+            'body': version.content,
+            'summary': version.summary,
+            'notes': version.notes
+        })
+        yield (b', ' if i else b'') + chunk
+    yield b']}'
+
+
 @bp.route('/content/<int:id>/audit-data')
 @login_required
-def get_audit_data(id):
+@require_content_access()
+def get_audit_data(content):
     """Returns all audit and patched data for an article's versions."""
-    content = NewsContent.query.get_or_404(id)
-
-    if not current_user.has_role('admin') and not current_user.has_publication_access(content.publication_id):
-        return jsonify({'error': 'Access denied'}), 403
-
     # Get all version audits for this content
-    version_audits = VersionAudit.query.filter_by(content_id=id).order_by(VersionAudit.created_at.desc()).all()
+    version_audits = VersionAudit.query.filter_by(content_id=content.id).order_by(VersionAudit.created_at.desc()).all()
 
     # Get all patched versions for this content
-    patched_versions = PatchedVersion.query.filter_by(content_id=id).order_by(PatchedVersion.created_at.desc()).all()
+    patched_versions = PatchedVersion.query.filter_by(content_id=content.id).order_by(PatchedVersion.created_at.desc()).all()
 
     return jsonify({
         'version_audits': [
@@ -848,7 +788,7 @@ CANDIDATE_SORT_DEFAULTS = {'score': 'desc', 'published': 'desc', 'discovered': '
 @login_required
 def candidates():
     """Paginated list of candidate articles with filters."""
-    page = request.args.get('page', 1, type=int)
+    page = max(request.args.get('page', 1, type=int), 1)
     status = request.args.get('status', 'new')
     min_score = request.args.get('min_score', 0, type=float)
     sort = request.args.get('sort', 'score')
@@ -874,9 +814,8 @@ def candidates():
 
     if publication_id:
         query = query.filter_by(publication_id=publication_id)
-    elif not current_user.has_role('admin') and current_user.publications:
-        pub_ids = current_user.get_publication_ids()
-        query = query.filter(CandidateArticle.publication_id.in_(pub_ids))
+    elif not current_user.has_role('admin') and g.user_pub_ids:
+        query = query.filter(CandidateArticle.publication_id.in_(g.user_pub_ids))
 
     if status != 'all':
         query = query.filter_by(status=status)
@@ -887,9 +826,15 @@ def candidates():
     sort_col = CANDIDATE_SORT_COLUMNS[sort]
     sort_expr = sort_col.desc() if direction == 'desc' else sort_col.asc()
     # Tiebreak by id for stable pagination across columns with duplicates
-    candidates_page = query.order_by(sort_expr, CandidateArticle.id.desc()).paginate(
-        page=page, per_page=current_app.config['ITEMS_PER_PAGE'], error_out=False
+    per_page = current_app.config['ITEMS_PER_PAGE']
+    items, has_next, total = _fetch_page(
+        query.order_by(sort_expr, CandidateArticle.id.desc()), page, per_page
     )
+    page_args = dict(status=status, sort=sort, direction=direction,
+                     publication_id=current_publication.id if current_publication else None,
+                     min_score=min_score if min_score else None)
+    prev_url = url_for('main.candidates', page=page - 1, **page_args) if page > 1 else None
+    next_url = url_for('main.candidates', page=page + 1, **page_args) if has_next else None
 
     author_profiles = []
     if publication_id:
@@ -898,7 +843,8 @@ def candidates():
         ).order_by(AuthorProfile.is_default.desc(), AuthorProfile.name).all()
 
     return render_template('main/candidates.html', title='Candidate Articles',
-                           candidates=candidates_page, status=status, min_score=min_score,
+                           items=items, total=total, page_start=(page - 1) * per_page + 1,
+                           prev_url=prev_url, next_url=next_url, status=status, min_score=min_score,
                            sort=sort, direction=direction,
                            publications=publications, current_publication=current_publication,
                            author_profiles=author_profiles)
@@ -910,7 +856,7 @@ def trigger_research(id):
     """Trigger research task from UI."""
     publication = Publication.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(id):
+    if not current_user.has_role('admin') and id not in g.user_pub_ids:
         flash('Access denied', 'error')
         return redirect(url_for('main.candidates'))
 
@@ -927,7 +873,7 @@ def update_candidate_status(id):
     """AJAX status update for a candidate (select/reject)."""
     candidate = CandidateArticle.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(candidate.publication_id):
+    if not current_user.has_role('admin') and candidate.publication_id not in g.user_pub_ids:
         return jsonify({'error': 'Access denied'}), 403
 
     new_status = request.json.get('status')
@@ -946,14 +892,14 @@ def create_article_from_candidate(id):
     """Send a candidate article's URL to the n8n submit-URL workflow."""
     candidate = CandidateArticle.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(candidate.publication_id):
+    if not current_user.has_role('admin') and candidate.publication_id not in g.user_pub_ids:
         return jsonify({'error': 'Access denied'}), 403
 
     workflow_url = current_app.config.get('N8N_SUBMIT_URL_WORKFLOW_URL')
     if not workflow_url:
         return jsonify({'error': 'Submit URL workflow not configured'}), 500
 
-    workflow_id = str(uuid.uuid4())
+    workflow_id = new_workflow_id()
     workflow_run = WorkflowRun(
         id=workflow_id,
         publication_id=candidate.publication_id,
@@ -979,7 +925,7 @@ def create_article_from_candidate(id):
             payload['author_style_guide'] = author.style_guide
 
     try:
-        requests.post(
+        HTTP.post(
             workflow_url,
             json=payload,
             headers={'Content-Type': 'application/json'},
@@ -1006,7 +952,7 @@ def candidate_detail(id):
     """Return candidate detail as JSON for the detail modal."""
     candidate = CandidateArticle.query.get_or_404(id)
 
-    if not current_user.has_role('admin') and not current_user.has_publication_access(candidate.publication_id):
+    if not current_user.has_role('admin') and candidate.publication_id not in g.user_pub_ids:
         return jsonify({'error': 'Access denied'}), 403
 
     metadata = candidate.extra_metadata or {}
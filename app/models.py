@@ -1,10 +1,23 @@
-from datetime import datetime
+import os
+import time
+import uuid
 from enum import Enum
+from functools import cached_property
 from flask_login import UserMixin
+from sqlalchemy.orm import validates
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db, login_manager
 
 
+def utc_now():
+    """SQL expression for the current time in UTC, as a naive timestamp.
+
+    Timestamp columns are naive and compared with datetime.utcnow(), so the
+    database must not apply its session timezone; plain now() would.
+    """
+    return db.func.timezone('utc', db.func.now())
+
+
 class SourceType(Enum):
     NEWS_SITE = "News Site"
     RSS_FEED = "RSS Feed"
@@ -56,10 +69,15 @@ class User(UserMixin, db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(256))
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
-    roles = db.relationship('Role', secondary=user_roles, backref=db.backref('users', lazy='dynamic'))
-    publications = db.relationship('Publication', secondary=user_publications, backref=db.backref('users', lazy='dynamic'))
+    # Loaded with the user (login/session restore) since every request checks them
+    roles = db.relationship('Role', secondary=user_roles, lazy='selectin',
+                            backref=db.backref('users', lazy='dynamic'))
+    # Access checks only need IDs (see publication_id_set), so don't pull
+    # the wide Publication rows on every user load
+    publications = db.relationship('Publication', secondary=user_publications,
+                                   backref=db.backref('users', lazy='dynamic'))
 
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
@@ -67,14 +85,37 @@ class User(UserMixin, db.Model):
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+    # Memoized per instance; current_user is reloaded on every request
+    @cached_property
+    def role_names(self):
+        return frozenset(role.name for role in self.roles)
+
+    @cached_property
+    def publication_id_set(self):
+        rows = db.session.query(user_publications.c.publication_id).filter(
+            user_publications.c.user_id == self.id
+        )
+        return frozenset(publication_id for (publication_id,) in rows)
+
+    def invalidate_access_cache(self):
+        """Drop memoized role/publication sets after editing roles or publications."""
+        self.__dict__.pop('role_names', None)
+        self.__dict__.pop('publication_id_set', None)
+
     def has_role(self, role_name):
-        return any(role.name == role_name for role in self.roles)
+        return role_name in self.role_names
 
     def has_publication_access(self, publication_id):
-        return any(pub.id == publication_id for pub in self.publications)
+        if 'publication_id_set' in self.__dict__:
+            return publication_id in self.publication_id_set
+        # One-off check: a single EXISTS on the association table
+        return db.session.query(db.exists().where(
+            user_publications.c.user_id == self.id,
+            user_publications.c.publication_id == publication_id,
+        )).scalar()
 
     def get_publication_ids(self):
-        return [pub.id for pub in self.publications]
+        return list(self.publication_id_set)
 
     def __repr__(self):
         return f'<User {self.username}>'
@@ -105,7 +146,7 @@ class Publication(db.Model):
     sponsy_api_key = db.Column(db.String(256))
     sponsy_publication_id = db.Column(db.String(128))
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     # Scheduling fields for automated content generation
     schedule_enabled = db.Column(db.Boolean, default=False)
@@ -136,6 +177,14 @@ class Publication(db.Model):
     newsletter_templates = db.relationship('NewsletterTemplate', backref='publication', lazy='dynamic', cascade='all, delete-orphan')
     newsletters = db.relationship('Newsletter', backref='publication', lazy='dynamic', cascade='all, delete-orphan')
 
+    @property
+    def cms_auth_header(self):
+        """CMS Authorization header value, adding the Bearer prefix if missing."""
+        api_key = self.cms_api_key or ''
+        if api_key[:7].lower() == 'bearer ':
+            return api_key
+        return f'Bearer {api_key}'
+
     def __repr__(self):
         return f'<Publication {self.name}>'
 
@@ -149,8 +198,8 @@ class NewsSource(db.Model):
     keywords = db.Column(db.Text)
     config = db.Column(db.JSON)
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
 
     def __repr__(self):
         return f'<NewsSource {self.name}>'
@@ -166,7 +215,7 @@ class ResearchLog(db.Model):
     message = db.Column(db.Text, nullable=False)
     url = db.Column(db.String(1024), nullable=True)
     details = db.Column(db.JSON, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, server_default=utc_now(), index=True)
 
     publication = db.relationship('Publication', backref='research_logs')
     news_source = db.relationship('NewsSource', backref='research_logs')
@@ -184,8 +233,8 @@ class AuthorProfile(db.Model):
     sample_articles = db.Column(db.JSON)
     is_default = db.Column(db.Boolean, default=False)
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
 
     publication = db.relationship('Publication', backref='author_profiles')
 
@@ -201,7 +250,7 @@ class WeeklyBriefing(db.Model):
     period_start = db.Column(db.Date, nullable=False)
     period_end = db.Column(db.Date, nullable=False)
     candidate_count = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     publication = db.relationship('Publication', backref='weekly_briefings')
 
@@ -221,6 +270,8 @@ class NewsContent(db.Model):
     notes = db.Column(db.Text)
     author = db.Column(db.String(256))
     source_url = db.Column(db.Text)
+    # url_hash() of source_url, kept in sync by _set_source_url_hash
+    source_url_hash = db.Column(db.String(64), index=True)
     source_name = db.Column(db.String(128))
     keywords = db.Column(db.Text)
     image_url = db.Column(db.String(512))
@@ -238,8 +289,8 @@ class NewsContent(db.Model):
     pushed_at = db.Column(db.DateTime)
     pushed_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now(), index=True)
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
 
     # Multi-version support
     selected_version_id = db.Column(db.Integer, db.ForeignKey('content_version.id', use_alter=True))
@@ -247,9 +298,22 @@ class NewsContent(db.Model):
     pushed_by = db.relationship('User', backref='pushed_content')
     selected_version = db.relationship('ContentVersion', foreign_keys=[selected_version_id], post_update=True)
 
+    __table_args__ = (
+        # Serves the dashboard's keyset pagination (scanned backwards for DESC)
+        db.Index('ix_news_content_pub_status_created_id', 'publication_id', 'status', 'created_at', 'id'),
+        # Same, for the status='all' view
+        db.Index('ix_news_content_pub_created_id', 'publication_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f'<NewsContent {self.title[:50]}>'
 
+    @validates('source_url')
+    def _set_source_url_hash(self, key, value):
+        from app.research.dedup import url_hash
+        self.source_url_hash = url_hash(value) if value else None
+        return value
+
     def get_display_version(self):
         """Returns the selected version or falls back to legacy content fields."""
         if self.selected_version:
@@ -288,7 +352,7 @@ class ContentVersion(db.Model):
     ghost_post_url = db.Column(db.String(512))
     ghost_pushed_at = db.Column(db.DateTime)
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     # Relationships
     news_content = db.relationship('NewsContent', foreign_keys=[content_id], backref='versions')
@@ -298,14 +362,26 @@ class ContentVersion(db.Model):
         return f'<ContentVersion {self.ai_provider} for content {self.content_id}>'
 
 
+def new_workflow_id():
+    """Return a time-ordered UUIDv7 string for WorkflowRun.id.
+
+    Unlike uuid4, consecutive IDs sort together, so inserts append to the
+    end of the primary key index instead of landing on random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
 class WorkflowRun(db.Model):
-    id = db.Column(db.String(36), primary_key=True)  # UUID
+    id = db.Column(db.String(36), primary_key=True)  # UUIDv7, see new_workflow_id()
     publication_id = db.Column(db.Integer, db.ForeignKey('publication.id'), nullable=False)
     triggered_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))
     workflow_type = db.Column(db.String(64), default='content_generation')
     status = db.Column(db.String(32), default='pending', index=True)  # pending, running, completed, failed
     message = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, server_default=utc_now(), index=True)
     completed_at = db.Column(db.DateTime)
 
     publication = db.relationship('Publication', backref='workflow_runs')
@@ -331,7 +407,7 @@ class VersionAudit(db.Model):
     # Issues found (JSON array)
     issues = db.Column(db.JSON, nullable=False)
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     # Relationships
     workflow_run = db.relationship('WorkflowRun', backref='version_audits')
@@ -353,7 +429,7 @@ class PatchedVersion(db.Model):
     # Patched content
     patched_draft = db.Column(db.Text, nullable=False)
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     # Relationships
     workflow_run = db.relationship('WorkflowRun', backref='patched_versions')
@@ -384,8 +460,8 @@ class CandidateArticle(db.Model):
     # Link to generated article
     news_content_id = db.Column(db.Integer, db.ForeignKey('news_content.id'), nullable=True)
 
-    discovered_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    discovered_at = db.Column(db.DateTime, server_default=utc_now(), index=True)
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
 
     __table_args__ = (
         db.UniqueConstraint('publication_id', 'url_hash', name='uq_candidate_pub_url'),
@@ -414,7 +490,7 @@ class NewsletterTemplate(db.Model):
     sponsy_mid_ad_block_id = db.Column(db.String(128))
     sponsy_mid_position = db.Column(db.Integer, default=3)
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
 
     newsletters = db.relationship('Newsletter', backref='template', lazy='dynamic')
 
@@ -431,8 +507,8 @@ class Newsletter(db.Model):
     intro_text = db.Column(db.Text)
     status = db.Column(db.String(32), default='draft')
     created_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utc_now())
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now())
 
     # Ghost push tracking
     pushed_to_ghost = db.Column(db.Boolean, default=False)
@@ -26,7 +26,7 @@ def generate_article_summary(content_text, title, publication):
     str
         A 2-3 paragraph summary suitable for a newsletter.
     """
-    import anthropic
+    from app.http_client import anthropic_client
 
     api_key = (current_app.config.get('ANTHROPIC_API_KEY') or '').strip().split()[0] if current_app.config.get('ANTHROPIC_API_KEY') else None
     if not api_key:
@@ -48,7 +48,7 @@ def generate_article_summary(content_text, title, publication):
     user_message = f"Article title: {title}\n\nArticle content:\n{content_text[:8000]}"
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = anthropic_client(api_key)
         response = client.messages.create(
             model='claude-haiku-4-5-20251001',
             max_tokens=1024,
@@ -82,7 +82,7 @@ def generate_newsletter_intro(articles, publication):
     str
         An intro paragraph for the newsletter.
     """
-    import anthropic
+    from app.http_client import anthropic_client
 
     api_key = (current_app.config.get('ANTHROPIC_API_KEY') or '').strip().split()[0] if current_app.config.get('ANTHROPIC_API_KEY') else None
     if not api_key:
@@ -120,7 +120,7 @@ def generate_newsletter_intro(articles, publication):
     user_message = f"Articles in this newsletter issue:\n{article_list}"
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = anthropic_client(api_key)
         response = client.messages.create(
             model='claude-haiku-4-5-20251001',
             max_tokens=512,
@@ -2,6 +2,7 @@ from datetime import datetime, date
 from flask import render_template, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import login_required, current_user
 from flask_wtf.csrf import generate_csrf
+from sqlalchemy.orm import joinedload
 from app import db
 from app.models import (
     Publication, NewsContent, Newsletter, NewsletterTemplate, NewsletterItem
@@ -104,13 +105,18 @@ def edit(id):
     template = newsletter.template
 
     # Get available articles (approved/published) for this publication
-    available_articles = NewsContent.query.filter(
+    # The template calls get_display_version() per article
+    available_articles = NewsContent.query.options(
+        joinedload(NewsContent.selected_version)
+    ).filter(
         NewsContent.publication_id == publication.id,
         NewsContent.status.in_(['approved', 'published'])
     ).order_by(NewsContent.created_at.desc()).all()
 
     # Get current newsletter items
-    items = NewsletterItem.query.filter_by(
+    items = NewsletterItem.query.options(
+        joinedload(NewsletterItem.news_content)
+    ).filter_by(
         newsletter_id=newsletter.id
     ).order_by(NewsletterItem.sort_order).all()
 
@@ -200,9 +206,12 @@ def generate_intro(id):
     if not news_content_ids:
         return jsonify({'error': 'news_content_ids required'}), 400
 
+    contents = {
+        str(c.id): c for c in NewsContent.query.filter(NewsContent.id.in_(news_content_ids))
+    }
     articles = []
     for cid in news_content_ids:
-        content = NewsContent.query.get(cid)
+        content = contents.get(str(cid))
         if content:
             articles.append({
                 'title': content.title,
@@ -314,7 +323,10 @@ def _render_newsletter_html(newsletter):
 
     template = newsletter.template
     publication = newsletter.publication
-    items = NewsletterItem.query.filter_by(
+    # Each item renders its content's display version
+    items = NewsletterItem.query.options(
+        joinedload(NewsletterItem.news_content).joinedload(NewsContent.selected_version)
+    ).filter_by(
         newsletter_id=newsletter.id
     ).order_by(NewsletterItem.sort_order).all()
 
@@ -1,5 +1,6 @@
 from app.research.scrapers import get_scraper, SCRAPER_REGISTRY
 from app.research.scoring import score_candidate
-from app.research.dedup import normalize_url, url_hash, is_duplicate_candidate, is_already_content
+from app.research.dedup import normalize_url, url_hash, is_duplicate_candidate, is_already_content, bulk_existing_hashes
 from app.research.enrichment import enrich_item
+from app.research.candidates import persist_candidates
 from app.research.triage import triage_items
@@ -0,0 +1,13 @@
+"""Persistence helpers for candidate articles."""
+from app import db
+from app.models import CandidateArticle
+
+
+def persist_candidates(rows: list) -> None:
+    """Insert candidates given as dicts keyed by CandidateArticle attribute names.
+
+    Uses a bulk insert, so no ORM object is built or tracked per row. The
+    caller commits (and handles IntegrityErrors from duplicate hashes).
+    """
+    if rows:
+        db.session.bulk_insert_mappings(CandidateArticle, rows)
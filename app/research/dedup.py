@@ -1,14 +1,20 @@
 """URL normalization and deduplication for candidate articles."""
 import hashlib
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 from app.models import CandidateArticle, NewsContent
 
-TRACKING_PARAMS = {
+TRACKING_PARAMS = frozenset({
     'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
     'fbclid', 'gclid', 'ref', 'mc_cid', 'mc_eid',
-}
+})
+
+_SINGLE_SLASH_SCHEME_RE = re.compile(r'^(https?):/?([^/])')
+
+# Max hashes per IN (...) list, to stay well under driver parameter limits
+IN_CHUNK_SIZE = 500
 
 
 def sanitize_url(url: str) -> str:
@@ -20,9 +26,13 @@ def sanitize_url(url: str) -> str:
     """
     if not url:
         return url
+    return _sanitize_and_parse(url)[0]
 
+
+def _sanitize_and_parse(url: str):
+    """sanitize_url() that also returns the parsed result, so callers don't parse twice."""
     # Fix scheme with single slash: https:/example.com → https://example.com
-    url = re.sub(r'^(https?):/?([^/])', r'\1://\2', url)
+    url = _SINGLE_SLASH_SCHEME_RE.sub(r'\1://\2', url)
 
     # Fix doubled domain in path: https://a.com/a.com/page → https://a.com/page
     parsed = urlparse(url)
@@ -30,32 +40,44 @@ def sanitize_url(url: str) -> str:
         fixed_path = parsed.path[len(parsed.netloc) + 1:]
         url = urlunparse((parsed.scheme, parsed.netloc, fixed_path,
                           parsed.params, parsed.query, parsed.fragment))
+        parsed = urlparse(url)
 
-    return url
+    return url, parsed
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     """Normalize a URL: lowercase scheme/host, strip fragments, remove tracking params, strip trailing slashes."""
-    url = sanitize_url(url)
-    parsed = urlparse(url)
+    if not url:
+        return url
+    parsed = _sanitize_and_parse(url)[1]
 
     scheme = parsed.scheme.lower()
     netloc = parsed.netloc.lower()
     path = parsed.path.rstrip('/')
 
+    # Most article URLs have no query string; skip the parse/encode round-trip
+    if not parsed.query:
+        return urlunparse((scheme, netloc, path, parsed.params, '', ''))
+
     # Remove tracking query parameters
     query_params = parse_qs(parsed.query, keep_blank_values=True)
-    filtered_params = {
-        k: v for k, v in query_params.items()
-        if k.lower() not in TRACKING_PARAMS
-    }
-    query = urlencode(filtered_params, doseq=True)
+    query = urlencode(
+        [(k, v) for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS],
+        doseq=True,
+    )
 
     return urlunparse((scheme, netloc, path, parsed.params, query, ''))
 
 
+@lru_cache(maxsize=8192)
 def url_hash(url: str) -> str:
-    """SHA-256 hash of the normalized URL."""
+    """SHA-256 hash of the normalized URL.
+
+    The hex digest is persisted (CandidateArticle.url_hash,
+    NewsContent.source_url_hash), so changing the algorithm or the
+    normalization means rehashing every stored row.
+    """
     normalized = normalize_url(url)
     return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
 
@@ -68,10 +90,35 @@ def is_duplicate_candidate(hash_value: str, publication_id: int) -> bool:
     ).first() is not None
 
 
-def is_already_content(url: str, publication_id: int) -> bool:
-    """Check if this URL already exists as a generated NewsContent source_url."""
-    normalized = normalize_url(url)
-    return NewsContent.query.filter(
-        NewsContent.publication_id == publication_id,
-        NewsContent.source_url.ilike(f'%{normalized}%'),
+def is_already_content(hash_value: str, publication_id: int) -> bool:
+    """Check if a NewsContent with this source_url_hash already exists for the publication."""
+    return NewsContent.query.filter_by(
+        publication_id=publication_id,
+        source_url_hash=hash_value,
     ).first() is not None
+
+
+def bulk_existing_hashes(hashes, publication_id: int) -> set:
+    """Return the subset of ``hashes`` already seen for the publication.
+
+    A hash counts as seen if it matches a CandidateArticle.url_hash or a
+    NewsContent.source_url_hash. Runs one query per table per chunk instead
+    of two per URL.
+    """
+    hashes = list(set(hashes))
+    existing = set()
+    for start in range(0, len(hashes), IN_CHUNK_SIZE):
+        chunk = hashes[start:start + IN_CHUNK_SIZE]
+        existing.update(h for (h,) in CandidateArticle.query.with_entities(
+            CandidateArticle.url_hash,
+        ).filter(
+            CandidateArticle.publication_id == publication_id,
+            CandidateArticle.url_hash.in_(chunk),
+        ))
+        existing.update(h for (h,) in NewsContent.query.with_entities(
+            NewsContent.source_url_hash,
+        ).filter(
+            NewsContent.publication_id == publication_id,
+            NewsContent.source_url_hash.in_(chunk),
+        ))
+    return existing
@@ -8,39 +8,61 @@ import logging
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import parse_qs, urlparse
 
+import orjson
 import requests
 from flask import current_app
 
+from app.concurrency import run_in_app_context
+from app.http_client import FIRECRAWL, firecrawl_headers, read_capped
+
 logger = logging.getLogger(__name__)
 
-# Simple rate limiter for Firecrawl API calls.
-# Firecrawl's standard plan allows ~20 req/min; we target ~10/min to stay safe.
-_FIRECRAWL_MIN_INTERVAL = 6.0  # seconds between requests
-_firecrawl_last_call = 0.0
+# Token-bucket rate limiter for Firecrawl API calls.
+# Firecrawl's standard plan allows ~20 req/min; we target ~10/min to stay safe,
+# with a small burst so a quiet period lets a few calls through back-to-back.
+_FIRECRAWL_MIN_INTERVAL = 6.0  # seconds per token
+_FIRECRAWL_BURST = 3
+_firecrawl_tokens = float(_FIRECRAWL_BURST)
+_firecrawl_refilled_at = time.monotonic()
 _firecrawl_lock = threading.Lock()
 
 
 def _firecrawl_rate_limit():
-    """Block until enough time has passed since the last Firecrawl call."""
-    global _firecrawl_last_call
+    """Block until this caller's Firecrawl slot comes up.
+
+    The lock only covers the token arithmetic: each caller reserves a token
+    (the count may go negative, queueing later callers behind it) and then
+    sleeps outside the lock until its reservation is due.
+    """
+    global _firecrawl_tokens, _firecrawl_refilled_at
     with _firecrawl_lock:
         now = time.monotonic()
-        elapsed = now - _firecrawl_last_call
-        if elapsed < _FIRECRAWL_MIN_INTERVAL:
-            time.sleep(_FIRECRAWL_MIN_INTERVAL - elapsed)
-        _firecrawl_last_call = time.monotonic()
-
-
-def enrich_item(url: str, metadata: dict, source_type: str, source_url: str = None) -> dict:
+        _firecrawl_tokens = min(
+            float(_FIRECRAWL_BURST),
+            _firecrawl_tokens + (now - _firecrawl_refilled_at) / _FIRECRAWL_MIN_INTERVAL,
+        )
+        _firecrawl_refilled_at = now
+        _firecrawl_tokens -= 1
+        wait = -_firecrawl_tokens * _FIRECRAWL_MIN_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def enrich_item(url: str, metadata: dict, source_type: str, source_url: str = None,
+                now: datetime = None) -> dict:
     """Enrich a candidate item with full content.
 
     Returns the metadata dict (mutated in place) with enrichment keys added.
-    Always returns metadata — never raises.
+    Always returns metadata — never raises. ``now`` lets batch callers share
+    one timestamp for enriched_at and date sanity checks.
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
     try:
         # Data sources are already enriched by Claude
         if source_type == 'Data':
@@ -50,14 +72,14 @@ def enrich_item(url: str, metadata: dict, source_type: str, source_url: str = No
 
         # RSS content available for free — promote it
         if 'rss_full_content' in metadata:
-            return _promote_rss_content(metadata)
+            return _promote_rss_content(metadata, now)
 
         # YouTube videos — fetch transcript
         if source_type == 'YouTube Keywords':
-            return _enrich_youtube_video(url, metadata)
+            return _enrich_youtube_video(url, metadata, now)
 
         # All other web sources — Firecrawl scrape
-        return _enrich_web_article(url, metadata, source_url=source_url)
+        return _enrich_web_article(url, metadata, now, source_url=source_url)
 
     except Exception as e:
         logger.error(f"Enrichment failed for {url}: {e}", exc_info=True)
@@ -66,14 +88,62 @@ def enrich_item(url: str, metadata: dict, source_type: str, source_url: str = No
         return metadata
 
 
-def _promote_rss_content(metadata: dict) -> dict:
+def enrich_items_parallel(jobs: list, max_workers: int = None, now: datetime = None) -> list:
+    """Run enrich_item over (url, metadata, source_type, source_url) tuples concurrently.
+
+    Returns the metadata dicts in the same order as ``jobs``. Jobs that need
+    no network call (Data sources, RSS promotion, unscrapable URLs) are
+    finished inline; only the rest go to the pool. Firecrawl calls are still
+    serialized by _firecrawl_rate_limit; the pool overlaps that wait with
+    transcript fetches and other network I/O.
+    """
+    if not jobs:
+        return []
+
+    app = current_app._get_current_object()
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if max_workers is None:
+        max_workers = app.config.get('ENRICH_WORKERS', 4)
+
+    results = [None] * len(jobs)
+    fetch_jobs = []
+    for i, job in enumerate(jobs):
+        if _needs_fetch(*job):
+            fetch_jobs.append((i, job))
+        else:
+            url, metadata, source_type, source_url = job
+            results[i] = enrich_item(url, metadata, source_type, source_url=source_url, now=now)
+
+    if fetch_jobs:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fetch_jobs)))) as pool:
+            futures = {
+                pool.submit(run_in_app_context, app, enrich_item, url, metadata, source_type,
+                            source_url=source_url, now=now): i
+                for i, (url, metadata, source_type, source_url) in fetch_jobs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    return results
+
+
+def _needs_fetch(url, metadata, source_type, source_url=None):
+    """Whether enrich_item would make a network call for this job (mirrors its dispatch)."""
+    if source_type == 'Data' or 'rss_full_content' in metadata:
+        return False
+    if source_type == 'YouTube Keywords':
+        return True
+    return _is_scrapable_url(url, source_url=source_url)
+
+
+def _promote_rss_content(metadata: dict, now: datetime) -> dict:
     """Promote RSS full content already captured by the scraper."""
     content = metadata.get('rss_full_content', '')
     metadata['full_content'] = content
     metadata['content_format'] = 'rss_html'
     metadata['content_source'] = 'rss_feed'
     metadata['content_length'] = len(content)
-    metadata['enriched_at'] = datetime.now(timezone.utc).isoformat()
+    metadata['enriched_at'] = now.isoformat()
     metadata['enrichment_failed'] = False
     metadata['enrichment_error'] = None
     return metadata
@@ -81,8 +151,23 @@ def _promote_rss_content(metadata: dict) -> dict:
 
 _youtube_blocked = False  # circuit breaker: skip after first IP ban
 
+# Shared transcript client so its HTTP session keeps connections alive
+_ytt_api = None
+_ytt_lock = threading.Lock()
+
+
+def _get_ytt_api():
+    """Return the process-wide YouTubeTranscriptApi, creating it on first use."""
+    global _ytt_api
+    if _ytt_api is None:
+        with _ytt_lock:
+            if _ytt_api is None:
+                from youtube_transcript_api import YouTubeTranscriptApi
+                _ytt_api = YouTubeTranscriptApi()
+    return _ytt_api
 
-def _enrich_youtube_video(url: str, metadata: dict) -> dict:
+
+def _enrich_youtube_video(url: str, metadata: dict, now: datetime) -> dict:
     """Fetch YouTube transcript using youtube-transcript-api."""
     global _youtube_blocked
     if _youtube_blocked:
@@ -97,20 +182,16 @@ def _enrich_youtube_video(url: str, metadata: dict) -> dict:
         return metadata
 
     try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-
-        ytt_api = YouTubeTranscriptApi()
-        transcript = ytt_api.fetch(video_id)
+        transcript = _get_ytt_api().fetch(video_id)
 
         # Combine transcript snippets into plain text
-        lines = [snippet.text for snippet in transcript.snippets]
-        full_text = ' '.join(lines)
+        full_text = ' '.join(snippet.text for snippet in transcript.snippets)
 
         metadata['full_content'] = full_text
         metadata['content_format'] = 'transcript'
         metadata['content_source'] = 'youtube_transcript'
         metadata['content_length'] = len(full_text)
-        metadata['enriched_at'] = datetime.now(timezone.utc).isoformat()
+        metadata['enriched_at'] = now.isoformat()
         metadata['enrichment_failed'] = False
         metadata['enrichment_error'] = None
 
@@ -128,36 +209,34 @@ def _enrich_youtube_video(url: str, metadata: dict) -> dict:
 
 
 # Schemes and domains that should never be sent to Firecrawl
-_SKIP_SCHEMES = {'mailto', 'tel', 'javascript', 'data', 'about'}
-_SKIP_DOMAINS = {
+_SKIP_SCHEMES = frozenset({'mailto', 'tel', 'javascript', 'data', 'about'})
+_SKIP_DOMAINS = frozenset({
     'facebook.com', 'www.facebook.com',
     'twitter.com', 'www.twitter.com', 'x.com', 'www.x.com',
     'instagram.com', 'www.instagram.com',
     'linkedin.com', 'www.linkedin.com',
     'tiktok.com', 'www.tiktok.com',
     'youtube.com', 'www.youtube.com',  # handled by transcript enrichment
-}
-# URL path patterns that indicate non-article pages (listing/nav pages)
-_SKIP_PATH_PATTERNS = re.compile(
-    r'/page/\d+$'              # pagination: /page/8
-    r'|-npage-\d+'             # alt pagination: /-npage-2
-    r'|/tag/'                  # tag listing pages
-    r'|/category/'             # category listing pages
-    r'|/author/'               # author listing pages
-    r'|/search'                # search results pages
-    r'|/archive/'              # archive listing pages
-    r'|/events?(/|$)'          # events section
-    r'|/member(/|$)'           # member pages
-    r'|/subscribe'             # subscribe pages
-    r'|/issue/'                # topic/issue listing pages
-    r'|sitemap\.xml',          # sitemaps
-    re.IGNORECASE,
-)
-
-# Regex for paths that are ONLY a date with no article slug after:
-# e.g. /2024/october  /2019/may-6-2019  /2009/jan-8-2009  but NOT /2026/january/actual-article-slug
-_DATE_ONLY_PATH = re.compile(
-    r'/\d{4}/(?:\d{1,2}|'
+})
+# URL path patterns that indicate non-article pages, checked in a single search:
+# file downloads, listing/nav pages, and paths that are ONLY a date with no
+# article slug after (e.g. /2024/october, /2019/may-6-2019, /2009/jan-8-2009
+# but NOT /2026/january/actual-article-slug)
+_NON_ARTICLE_PATH = re.compile(
+    r'\.(?:pdf|xml|json|csv)$'  # file types
+    r'|/page/\d+$'              # pagination: /page/8
+    r'|-npage-\d+'              # alt pagination: /-npage-2
+    r'|/tag/'                   # tag listing pages
+    r'|/category/'              # category listing pages
+    r'|/author/'                # author listing pages
+    r'|/search'                 # search results pages
+    r'|/archive/'               # archive listing pages
+    r'|/events?(/|$)'           # events section
+    r'|/member(/|$)'            # member pages
+    r'|/subscribe'              # subscribe pages
+    r'|/issue/'                 # topic/issue listing pages
+    r'|sitemap\.xml'            # sitemaps
+    r'|/\d{4}/(?:\d{1,2}|'      # date-only archive paths
     r'january|february|march|april|may|june|'
     r'july|august|september|october|november|december'
     r')(?:-\d{1,2}-\d{4})?/?$',
@@ -165,6 +244,21 @@ _DATE_ONLY_PATH = re.compile(
 )
 
 
+def _split_url(url: str):
+    """Cheap (scheme, host, path) split matching urlparse for http(s) URLs.
+
+    The path excludes the query, fragment and any ;params on the last segment.
+    """
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return scheme.lower(), '', ''
+    for delim in '?#':
+        rest = rest.partition(delim)[0]
+    host, slash, path = rest.partition('/')
+    head, slash2, last = (slash + path).rpartition('/')
+    return scheme.lower(), host, head + slash2 + last.partition(';')[0]
+
+
 def _is_scrapable_url(url: str, source_url: str = None) -> bool:
     """Check if a URL looks like an article worth sending to Firecrawl.
 
@@ -172,56 +266,47 @@ def _is_scrapable_url(url: str, source_url: str = None) -> bool:
     and non-HTTP schemes. Optionally checks against the source's own URL
     to avoid scraping the listing page itself.
     """
-    parsed = urlparse(url)
+    scheme, host, path = _split_url(url)
 
     # Scheme checks
-    if parsed.scheme in _SKIP_SCHEMES:
+    if scheme in _SKIP_SCHEMES:
         return False
-    if not parsed.netloc:
+    if not host:
         return False
 
     # Domain checks
-    if parsed.netloc.lower() in _SKIP_DOMAINS:
+    if host.lower() in _SKIP_DOMAINS:
         return False
 
-    path = parsed.path.rstrip('/')
-
-    # File type checks
-    lower_path = path.lower()
-    if lower_path.endswith(('.pdf', '.xml', '.json', '.csv')):
-        return False
+    path = path.rstrip('/')
 
     # Fragment-only or empty path
-    if not path or path == '/':
+    if not path:
         return False
     if url.endswith('#') or url.endswith('#content'):
         return False
 
-    # Known non-article path patterns
-    if _SKIP_PATH_PATTERNS.search(path):
-        return False
-
-    # Date-only paths (month archive listings, not articles)
-    if _DATE_ONLY_PATH.search(path):
+    # File types, known non-article path patterns and date-only paths
+    if _NON_ARTICLE_PATH.search(path):
         return False
 
     # Single-segment paths: only allow if the slug is long enough to be an article
     # Nav pages have short slugs like /publications, /news-events, /press-releases
     # Article slugs are URL-ified titles: /statement-on-stb-decision, /farm-bill-process
-    segments = [s for s in path.split('/') if s]
-    if len(segments) < 2 and len(segments[-1] if segments else '') < 16:
+    slug = path.lstrip('/')
+    if '/' not in slug and len(slug) < 16:
         return False
 
     # Skip if URL matches the source listing page itself
     if source_url:
-        source_path = urlparse(source_url).path.rstrip('/')
+        source_path = _split_url(source_url)[2].rstrip('/')
         if path == source_path:
             return False
 
     return True
 
 
-def _enrich_web_article(url: str, metadata: dict, source_url: str = None) -> dict:
+def _enrich_web_article(url: str, metadata: dict, now: datetime, source_url: str = None) -> dict:
     """Fetch full article content via Firecrawl /scrape endpoint."""
     if not _is_scrapable_url(url, source_url=source_url):
         metadata['enrichment_failed'] = True
@@ -246,7 +331,7 @@ def _enrich_web_article(url: str, metadata: dict, source_url: str = None) -> dic
         metadata['content_format'] = 'markdown'
         metadata['content_source'] = 'firecrawl'
         metadata['content_length'] = len(markdown)
-        metadata['enriched_at'] = datetime.now(timezone.utc).isoformat()
+        metadata['enriched_at'] = now.isoformat()
         metadata['enrichment_failed'] = False
         metadata['enrichment_error'] = None
     else:
@@ -256,9 +341,9 @@ def _enrich_web_article(url: str, metadata: dict, source_url: str = None) -> dic
     # Extract publish date: OG meta → page content → URL pattern
     page_meta = scrape_data.get('metadata', {})
     published_date = (
-        _extract_publish_date(page_meta)
-        or _extract_date_from_content(markdown)
-        or _extract_date_from_url(url)
+        _extract_publish_date(page_meta, now)
+        or _extract_date_from_content(markdown, now)
+        or _extract_date_from_url(url, now)
     )
     if published_date:
         metadata['extracted_published_date'] = published_date.isoformat()
@@ -268,35 +353,38 @@ def _enrich_web_article(url: str, metadata: dict, source_url: str = None) -> dic
 
 def _firecrawl_scrape(url: str, api_key: str) -> Optional[dict]:
     """Call Firecrawl /scrape with markdown format. Returns the data dict. Single retry on 429."""
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json',
-    }
+    headers = firecrawl_headers(api_key)
     payload = {
         'url': url,
         'formats': ['markdown'],
     }
 
+    max_bytes = current_app.config.get('FIRECRAWL_MAX_RESPONSE_BYTES', 2 * 1024 * 1024)
+
     for attempt in range(2):
         _firecrawl_rate_limit()
         try:
-            resp = requests.post(
+            with FIRECRAWL.post(
                 'https://api.firecrawl.dev/v1/scrape',
                 headers=headers,
                 json=payload,
-                timeout=60,
-            )
-
-            if resp.status_code == 429 and attempt == 0:
-                retry_after = int(resp.headers.get('Retry-After', 10))
-                logger.info(f"Firecrawl 429 for {url}, retrying after {retry_after}s")
-                time.sleep(retry_after)
-                continue
-
-            resp.raise_for_status()
-            return resp.json().get('data', {})
-
-        except requests.RequestException as e:
+                timeout=(5, 60),
+                stream=True,
+            ) as resp:
+                if resp.status_code == 429 and attempt == 0:
+                    retry_after = int(resp.headers.get('Retry-After', 10))
+                    logger.info(f"Firecrawl 429 for {url}, retrying after {retry_after}s")
+                    time.sleep(retry_after)
+                    continue
+
+                resp.raise_for_status()
+                body = read_capped(resp, max_bytes)
+                if body is None:
+                    logger.warning(f"Firecrawl /scrape response for {url} exceeds {max_bytes} bytes, skipping")
+                    return None
+                return orjson.loads(body).get('data', {})
+
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             if attempt == 0 and '429' in str(e):
                 time.sleep(10)
                 continue
@@ -306,7 +394,7 @@ def _firecrawl_scrape(url: str, api_key: str) -> Optional[dict]:
     return None
 
 
-def _extract_publish_date(page_metadata: dict) -> Optional[datetime]:
+def _extract_publish_date(page_metadata: dict, now: datetime = None) -> Optional[datetime]:
     """Extract a publish date from Firecrawl page metadata.
 
     Firecrawl returns OG/meta tags like publishedTime, modifiedTime,
@@ -314,6 +402,9 @@ def _extract_publish_date(page_metadata: dict) -> Optional[datetime]:
     """
     from dateutil.parser import parse as parse_date
 
+    if now is None:
+        now = datetime.now(timezone.utc)
+
     # Try fields in priority order — publishedTime is most reliable
     date_fields = [
         'publishedTime',
@@ -329,7 +420,6 @@ def _extract_publish_date(page_metadata: dict) -> Optional[datetime]:
             try:
                 dt = parse_date(str(value))
                 # Sanity check: not in the future, not older than 10 years
-                now = datetime.now(timezone.utc)
                 if dt.tzinfo is None:
                     dt = dt.replace(tzinfo=timezone.utc)
                 if dt <= now and (now - dt).days < 3650:
@@ -361,7 +451,7 @@ _CONTENT_DATE_PATTERNS = [
 ]
 
 
-def _extract_date_from_content(markdown: Optional[str]) -> Optional[datetime]:
+def _extract_date_from_content(markdown: Optional[str], now: datetime = None) -> Optional[datetime]:
     """Extract a publish date from the first portion of page content.
 
     Scans the first ~1500 chars of markdown for common date patterns.
@@ -374,7 +464,8 @@ def _extract_date_from_content(markdown: Optional[str]) -> Optional[datetime]:
 
     # Only scan the top of the page where dates typically appear
     header = markdown[:1500]
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     for pattern in _CONTENT_DATE_PATTERNS:
         m = pattern.search(header)
@@ -395,9 +486,6 @@ def _extract_date_from_content(markdown: Optional[str]) -> Optional[datetime]:
 #   /2025/02/19/article-slug  or  /2025/02/article-slug
 #   /2025/february/article-slug
 #   /2025-02-19-article-slug  (press release style)
-_URL_DATE_FULL = re.compile(r'/(\d{4})/(\d{1,2})/(\d{1,2})/')
-_URL_DATE_HYPHEN = re.compile(r'/(\d{4})-(\d{2})-(\d{2})-')
-_URL_DATE_MONTH = re.compile(r'/(\d{4})/(\d{1,2})/')
 _MONTH_NAMES = {
     'january': 1, 'february': 2, 'march': 3, 'april': 4,
     'may': 5, 'june': 6, 'july': 7, 'august': 8,
@@ -406,90 +494,117 @@ _MONTH_NAMES = {
     'jun': 6, 'jul': 7, 'aug': 8, 'sep': 9,
     'oct': 10, 'nov': 11, 'dec': 12,
 }
-_URL_DATE_NAMED_MONTH = re.compile(
-    r'/(\d{4})/(' + '|'.join(_MONTH_NAMES) + r')(?:[/-]|$)',
+# All URL date patterns in one pass. The lookahead makes every match
+# zero-width, so finditer reports each /YYYY position even when patterns overlap.
+_URL_DATE = re.compile(
+    r'(?=/(?P<year>\d{4})(?:'
+    r'/(?P<month>\d{1,2})/(?:(?P<day>\d{1,2})/)?'         # /YYYY/MM/ or /YYYY/MM/DD/
+    r'|-(?P<h_month>\d{2})-(?P<h_day>\d{2})-'            # /YYYY-MM-DD-slug
+    r'|/(?P<month_name>' + '|'.join(_MONTH_NAMES) + r')(?:[/-]|$)'  # /YYYY/february/
+    r'|/(?![0-9])'                                        # /YYYY/slug
+    r'))',
     re.IGNORECASE,
 )
-# Year-only pattern: /YYYY/ followed by a slug (not another number segment)
-_URL_DATE_YEAR_ONLY = re.compile(r'/(\d{4})/(?![0-9])')
 
 
-def _extract_date_from_url(url: str) -> Optional[datetime]:
+@lru_cache(maxsize=4096)
+def _first_url_date_matches(url: str) -> dict:
+    """Map each URL date pattern to the groups of its leftmost match.
+
+    Cached per URL; the returned dict is shared, so don't mutate it.
+    """
+    found = {}
+    for m in _URL_DATE.finditer(url):
+        year = m.group('year')
+        if m.group('month'):
+            if m.group('day'):
+                found.setdefault('full', (year, m.group('month'), m.group('day')))
+            found.setdefault('month', (year, m.group('month')))
+        elif m.group('h_month'):
+            found.setdefault('hyphen', (year, m.group('h_month'), m.group('h_day')))
+        else:
+            # A named month position is also a valid year-only position
+            if m.group('month_name'):
+                found.setdefault('named', (year, m.group('month_name')))
+            found.setdefault('year', year)
+    return found
+
+
+def _extract_date_from_url(url: str, now: datetime = None) -> Optional[datetime]:
     """Extract a publish date from common URL path patterns like /2025/02/19/.
 
     Returns dates up to 10 years old — callers decide how to handle old dates
-    (e.g. low recency score, max-age filter).
+    (e.g. low recency score, max-age filter). Only the URL parse is cached;
+    the checks against ``now`` run on every call.
     """
-    now = datetime.now(timezone.utc)
-
-    # Try full date: /YYYY/MM/DD/
-    m = _URL_DATE_FULL.search(url)
-    if m:
-        try:
-            dt = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=timezone.utc)
-            if dt <= now and (now - dt).days < 3650:
-                return dt
-        except ValueError:
-            pass
-
-    # Try hyphenated date: /YYYY-MM-DD-slug (press releases, investor pages)
-    m = _URL_DATE_HYPHEN.search(url)
-    if m:
-        try:
-            dt = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=timezone.utc)
-            if dt <= now and (now - dt).days < 3650:
-                return dt
-        except ValueError:
-            pass
+    if now is None:
+        now = datetime.now(timezone.utc)
+    found = _first_url_date_matches(url)
+
+    # Try full date: /YYYY/MM/DD/, then hyphenated date: /YYYY-MM-DD-slug
+    # (press releases, investor pages)
+    for kind in ('full', 'hyphen'):
+        if kind in found:
+            year, month, day = found[kind]
+            try:
+                dt = datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+                if dt <= now and (now - dt).days < 3650:
+                    return dt
+            except ValueError:
+                pass
 
     # Try year/month: /YYYY/MM/
-    m = _URL_DATE_MONTH.search(url)
-    if m:
+    if 'month' in found:
+        year, month = found['month']
         try:
-            dt = datetime(int(m.group(1)), int(m.group(2)), 1, tzinfo=timezone.utc)
+            dt = datetime(int(year), int(month), 1, tzinfo=timezone.utc)
             if dt <= now and (now - dt).days < 3650:
                 return dt
         except ValueError:
             pass
 
     # Try named month: /YYYY/february/ or /YYYY/jan-13-2014/
-    m = _URL_DATE_NAMED_MONTH.search(url)
-    if m:
-        month_num = _MONTH_NAMES.get(m.group(2).lower())
+    if 'named' in found:
+        year, month_name = found['named']
+        month_num = _MONTH_NAMES.get(month_name.lower())
         if month_num:
             try:
-                dt = datetime(int(m.group(1)), month_num, 1, tzinfo=timezone.utc)
+                dt = datetime(int(year), month_num, 1, tzinfo=timezone.utc)
                 if dt <= now and (now - dt).days < 3650:
                     return dt
             except ValueError:
                 pass
 
     # Try year-only: /YYYY/slug (assume Jan 1 of that year)
-    m = _URL_DATE_YEAR_ONLY.search(url)
-    if m:
-        try:
-            year = int(m.group(1))
-            if 2000 <= year <= now.year:
-                dt = datetime(year, 1, 1, tzinfo=timezone.utc)
-                if (now - dt).days < 3650:
-                    return dt
-        except ValueError:
-            pass
+    if 'year' in found:
+        year = int(found['year'])
+        if 2000 <= year <= now.year:
+            dt = datetime(year, 1, 1, tzinfo=timezone.utc)
+            if (now - dt).days < 3650:
+                return dt
 
     return None
 
 
+_YOUTUBE_HOSTS = frozenset({'www.youtube.com', 'youtube.com', 'm.youtube.com'})
+_YT_V_RE = re.compile(r'[?&]v=([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])')
+_YT_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+
+
 def _extract_youtube_video_id(url: str) -> Optional[str]:
     """Extract video ID from various YouTube URL formats."""
-    parsed = urlparse(url)
-
-    if parsed.hostname in ('www.youtube.com', 'youtube.com', 'm.youtube.com'):
-        if parsed.path == '/watch':
-            qs = parse_qs(parsed.query)
-            return qs.get('v', [None])[0]
-        if parsed.path.startswith('/shorts/'):
-            return parsed.path.split('/shorts/')[1].split('/')[0]
-    elif parsed.hostname == 'youtu.be':
-        return parsed.path.lstrip('/')
+    _, host, path = _split_url(url)
+    host = host.partition(':')[0].lower()
+
+    if host in _YOUTUBE_HOSTS:
+        if path == '/watch':
+            m = _YT_V_RE.search(url.partition('#')[0])
+            return m.group(1) if m else None
+        if path.startswith('/shorts/'):
+            video_id = path[len('/shorts/'):].partition('/')[0]
+            return video_id if _YT_ID_RE.fullmatch(video_id) else None
+    elif host == 'youtu.be':
+        video_id = path.lstrip('/').partition('/')[0]
+        return video_id if _YT_ID_RE.fullmatch(video_id) else None
 
     return None
@@ -1,6 +1,8 @@
 """Heuristic scoring for candidate articles."""
 import re
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 
 
 # Source type weights (0-1)
@@ -14,30 +16,46 @@ SOURCE_WEIGHTS = {
     'Data': 0.85,
     'House Content': 0.3,
 }
+_DEFAULT_SOURCE_WEIGHT = 0.5
 
+# Recency buckets: an article under _RECENCY_DAY_CUTS[i] days old (and not
+# under the previous cut) scores _RECENCY_SCORES[i]; anything older than the
+# last cut scores _RECENCY_SCORES[-1]
+_RECENCY_DAY_CUTS = (1, 2, 4, 8, 15, 29)
+_RECENCY_SCORES = (100.0, 85.0, 70.0, 50.0, 30.0, 15.0, 5.0)
 
-def _extract_terms(text: str) -> list:
+
+_TERM_RE = re.compile(r'[a-zA-Z]{3,}')
+
+# Common stop words filtered out of extracted terms
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can',
+    'her', 'was', 'one', 'our', 'out', 'has', 'have', 'been', 'from',
+    'with', 'they', 'this', 'that', 'will', 'each', 'which', 'their',
+    'about', 'would', 'there', 'these', 'other', 'into', 'more', 'some',
+})
+
+
+@lru_cache(maxsize=512)
+def _extract_terms(text: str) -> tuple:
     """Extract meaningful words from text, lowercased and deduplicated."""
     if not text:
-        return []
-    words = re.findall(r'[a-zA-Z]{3,}', text.lower())
-    # Filter common stop words
-    stop_words = {
-        'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can',
-        'her', 'was', 'one', 'our', 'out', 'has', 'have', 'been', 'from',
-        'with', 'they', 'this', 'that', 'will', 'each', 'which', 'their',
-        'about', 'would', 'there', 'these', 'other', 'into', 'more', 'some',
-    }
-    return [w for w in words if w not in stop_words]
+        return ()
+    return tuple(w for w in _TERM_RE.findall(text.lower()) if w not in _STOP_WORDS)
+
+
+@lru_cache(maxsize=256)
+def _keyword_terms(industry_description: str, source_keywords: str) -> frozenset:
+    """Unique publication/source terms; constant across a source's candidates, so memoized."""
+    return frozenset(_extract_terms(industry_description) + _extract_terms(source_keywords))
 
 
 def compute_keyword_score(title: str, snippet: str, industry_description: str, source_keywords: str) -> float:
     """Score 0-100 based on keyword matches between candidate text and publication/source terms."""
-    terms = _extract_terms(industry_description) + _extract_terms(source_keywords)
-    if not terms:
+    unique_terms = _keyword_terms(industry_description, source_keywords)
+    if not unique_terms:
         return 50.0  # No keywords configured, neutral score
 
-    unique_terms = list(set(terms))
     candidate_text = f"{title or ''} {snippet or ''}".lower()
 
     matches = sum(1 for term in unique_terms if term in candidate_text)
@@ -54,28 +72,13 @@ def compute_recency_score(published_date: datetime) -> float:
     if published_date.tzinfo is not None:
         published_date = published_date.replace(tzinfo=None)
 
-    delta = now - published_date
-    days = delta.total_seconds() / 86400
-
-    if days < 1:
-        return 100.0
-    elif days < 2:
-        return 85.0
-    elif days < 4:
-        return 70.0
-    elif days < 8:
-        return 50.0
-    elif days < 15:
-        return 30.0
-    elif days < 29:
-        return 15.0
-    else:
-        return 5.0
+    days = (now - published_date).total_seconds() / 86400
+    return _RECENCY_SCORES[bisect_right(_RECENCY_DAY_CUTS, days)]
 
 
 def get_source_weight(source_type: str) -> float:
     """Get the weight for a source type (0-1)."""
-    return SOURCE_WEIGHTS.get(source_type, 0.5)
+    return SOURCE_WEIGHTS.get(source_type, _DEFAULT_SOURCE_WEIGHT)
 
 
 def score_candidate(title: str, snippet: str, published_date: datetime,
@@ -86,15 +89,16 @@ def score_candidate(title: str, snippet: str, published_date: datetime,
     """
     kw_score = compute_keyword_score(title, snippet, industry_description, source_keywords)
     rec_score = compute_recency_score(published_date)
-    sw = get_source_weight(source_type)
+    sw = SOURCE_WEIGHTS.get(source_type, _DEFAULT_SOURCE_WEIGHT)
 
+    # Source weight is 0-1; its factors below are pre-multiplied by 100
     if published_date:
         # Standard weights: keyword 50%, recency 30%, source 20%
-        relevance = (kw_score * 0.50) + (rec_score * 0.30) + (sw * 100 * 0.20)
+        relevance = (kw_score * 0.50) + (rec_score * 0.30) + (sw * 20.0)
     else:
         # No date: redistribute recency weight to keyword and source (keep ratio)
         # keyword 71.4% (0.50/0.70), source 28.6% (0.20/0.70)
-        relevance = (kw_score * 0.714) + (sw * 100 * 0.286)
+        relevance = (kw_score * 0.714) + (sw * 28.6)
 
     return {
         'keyword_score': round(kw_score, 2),
@@ -1,21 +1,33 @@
 """Source-type-specific scraping strategies for candidate article discovery."""
-import io
-import json
+import hashlib
 import logging
+import os
+import re
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
 
 import feedparser
+import orjson
 import requests
 from flask import current_app
 
+from app.cache import cache_get, cache_set
+from app.http_client import FIRECRAWL, HTTP, anthropic_client, firecrawl_headers
+
 logger = logging.getLogger(__name__)
 
+# Opening ```json / closing ``` lines around a model's JSON reply
+_CODE_FENCE_RE = re.compile(r'^```[^\n]*\n?|\n?```$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredItem:
     url: str
     title: Optional[str] = None
@@ -28,23 +40,49 @@ class DiscoveredItem:
 class BaseScraper:
     """Abstract base class for source scrapers."""
 
+    @staticmethod
+    def _dedupe(items: List[DiscoveredItem]) -> List[DiscoveredItem]:
+        """Drop items whose URL normalizes to one already seen, keeping the first."""
+        from app.research.dedup import normalize_url
+
+        seen = set()
+        unique = []
+        for item in items:
+            key = normalize_url(item.url)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+        return unique
+
     def _firecrawl_headers(self):
-        api_key = current_app.config.get('FIRECRAWL_API_KEY')
-        return {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json',
-        }
+        return firecrawl_headers(current_app.config.get('FIRECRAWL_API_KEY'))
 
-    def _firecrawl_request(self, endpoint: str, payload: dict,
-                           timeout: int = 60, max_retries: int = 2) -> Optional[dict]:
+    def _firecrawl_request(self, endpoint: str, payload: dict, timeout: int = 60,
+                           max_retries: int = 2, cached: bool = False) -> Optional[dict]:
         """POST to a Firecrawl endpoint with retry on transient connection errors and 429s.
 
+        With ``cached``, a successful response is kept in Redis for
+        FIRECRAWL_CACHE_TTL seconds and identical requests reuse it.
+
         Returns the parsed JSON response or None on failure.
         """
+        cache_key = None
+        ttl = current_app.config.get('FIRECRAWL_CACHE_TTL', 0) if cached else 0
+        if ttl:
+            digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+            cache_key = f"firecrawl:{endpoint}:{digest}"
+            hit = cache_get(cache_key)
+            if hit is not None:
+                try:
+                    return orjson.loads(hit)
+                except orjson.JSONDecodeError:
+                    pass
+
         backoff = 5
         for attempt in range(max_retries):
             try:
-                resp = requests.post(
+                resp = FIRECRAWL.post(
                     f'https://api.firecrawl.dev/v1/{endpoint}',
                     headers=self._firecrawl_headers(),
                     json=payload,
@@ -57,7 +95,10 @@ class BaseScraper:
                     backoff *= 2
                     continue
                 resp.raise_for_status()
-                return resp.json()
+                data = orjson.loads(resp.content)
+                if cache_key:
+                    cache_set(cache_key, resp.content, ttl)
+                return data
             except (requests.ConnectionError, requests.Timeout) as e:
                 if attempt < max_retries - 1:
                     logger.warning(
@@ -69,7 +110,7 @@ class BaseScraper:
                     continue
                 logger.error(f"Firecrawl /{endpoint} failed after {max_retries} attempts: {e}")
                 return None
-            except requests.RequestException as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 logger.error(f"Firecrawl /{endpoint} request error: {e}")
                 return None
         return None
@@ -77,16 +118,65 @@ class BaseScraper:
     def scrape(self, source) -> List[DiscoveredItem]:
         raise NotImplementedError
 
+    def apply_source_state(self, source) -> None:
+        """Write state learned by the last scrape() onto ``source``.
+
+        Does not commit: callers apply it in the transaction that saves the
+        scraped items, so a run that never saves them doesn't record them
+        as seen.
+        """
+
+
+# Content-Type fragments and body prefixes that mark a probed URL as a feed
+_FEED_CONTENT_TYPES = ('xml', 'rss', 'atom', 'feed')
+_FEED_BODY_RE = re.compile(rb'(?:\xef\xbb\xbf)?\s*<(?:\?xml|rss|feed)')
+
+# Same identity feedparser sends when it fetches a feed itself
+_FEED_REQUEST_HEADERS = {
+    'User-Agent': feedparser.USER_AGENT,
+    'Accept': 'application/atom+xml,application/rdf+xml,application/rss+xml,'
+              'application/xml;q=0.9,text/xml;q=0.2,*/*;q=0.1',
+}
+
 
 class RSSFeedScraper(BaseScraper):
     """Parse RSS/Atom feeds using feedparser."""
 
+    def __init__(self):
+        # (etag, last_modified) from the last 200 response, if they changed
+        self._feed_validators = None
+
     def scrape(self, source) -> List[DiscoveredItem]:
+        self._feed_validators = None
         if not source.url:
             return []
 
+        # Conditional GET: an unchanged feed answers 304 with no body, and
+        # everything it listed last time has already been through dedup.
+        headers = dict(_FEED_REQUEST_HEADERS)
+        validators = (source.config or {}).get('rss_cache') or {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
         try:
-            feed = feedparser.parse(source.url)
+            resp = HTTP.get(source.url, headers=headers, timeout=15)
+            if resp.status_code == 304:
+                logger.info(f"RSS feed {source.url} not modified since last scrape")
+                return []
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch RSS feed {source.url}: {e}")
+            return []
+
+        try:
+            # Hand feedparser the bytes plus the headers it would have seen, so
+            # charset detection and relative-link resolution behave as before.
+            feed = feedparser.parse(resp.content, response_headers={
+                'content-type': resp.headers.get('Content-Type', ''),
+                'content-location': resp.url,
+            })
         except Exception as e:
             logger.error(f"Failed to parse RSS feed {source.url}: {e}")
             return []
@@ -128,8 +218,25 @@ class RSSFeedScraper(BaseScraper):
                 metadata=metadata,
             ))
 
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        if validators.get('etag') != etag or validators.get('last_modified') != last_modified:
+            self._feed_validators = (etag, last_modified)
         return items
 
+    def apply_source_state(self, source) -> None:
+        if self._feed_validators is None:
+            return
+        etag, last_modified = self._feed_validators
+
+        # SQLAlchemy needs a new dict reference to detect JSON changes
+        updated_config = dict(source.config or {})
+        if etag or last_modified:
+            updated_config['rss_cache'] = {'etag': etag, 'last_modified': last_modified}
+        else:
+            updated_config.pop('rss_cache', None)
+        source.config = updated_config
+
 
 class NewsSiteScraper(BaseScraper):
     """Discover articles on a news site. Tries RSS feed first, falls back to Firecrawl /map."""
@@ -140,6 +247,10 @@ class NewsSiteScraper(BaseScraper):
         '/atom.xml', '/feeds/posts/default',
         '/news/feed', '/news/rss', '/blog/feed', '/blog/rss',
     ]
+    # Concurrent feed-path probes per site
+    _FEED_PROBE_WORKERS = 6
+    # How long a "no feed" result is cached when some probes failed transiently
+    _FEED_RETRY_TTL = 300
     # WordPress REST API posts endpoint
     _WP_API_PATH = '/wp-json/wp/v2/posts?per_page=20&orderby=date&order=desc'
 
@@ -159,9 +270,11 @@ class NewsSiteScraper(BaseScraper):
             logger.warning("FIRECRAWL_API_KEY not configured, skipping NewsSiteScraper")
             return []
 
-        items = self._map_site(source)
+        # /map and the link-scrape fallback often list the same pages; dedupe
+        # before the short-result check and the cap so repeats don't use slots
+        items = self._dedupe(self._map_site(source))
         if len(items) < 5:
-            items.extend(self._scrape_links_fallback(source))
+            items = self._dedupe(items + self._scrape_links_fallback(source))
 
         # Cap /map results: these are undated bare URLs, so limit to avoid
         # flooding triage/enrichment with potentially old content.
@@ -172,16 +285,43 @@ class NewsSiteScraper(BaseScraper):
         return items
 
     def _try_rss_feed(self, source) -> List[DiscoveredItem]:
-        """Probe common RSS feed paths on the site. Returns items if a feed is found."""
+        """Probe common RSS feed paths on the site. Returns items if a feed is found.
+
+        The outcome is remembered per host for FEED_DISCOVERY_CACHE_TTL
+        seconds: a known feed URL is fetched directly, and a host known to
+        have no feed at these paths goes straight to the WordPress API.
+        """
         parsed = urlparse(source.url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        # Try RSS/Atom feeds first
-        for feed_path in self._FEED_PATHS:
-            feed_url = base_url + feed_path
-            items = self._parse_rss_url(feed_url)
+        ttl = current_app.config.get('FEED_DISCOVERY_CACHE_TTL', 0)
+        cache_key = f"feedpath:{parsed.netloc.lower()}"
+        cached = cache_get(cache_key) if ttl else None
+
+        if cached:
+            items = self._parse_rss_url(cached.decode())
             if items:
                 return items
+            # Feed moved or went away; probe again below
+            cached = None
+
+        # Try RSS/Atom feeds first. Probes run concurrently, but results are
+        # taken in _FEED_PATHS order so the preferred path still wins.
+        if cached is None:
+            feed_urls = [base_url + feed_path for feed_path in self._FEED_PATHS]
+            transient = False
+            with ThreadPoolExecutor(max_workers=self._FEED_PROBE_WORKERS) as pool:
+                for feed_url, (items, failed) in zip(feed_urls, pool.map(self._probe_feed, feed_urls)):
+                    if items:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        if ttl:
+                            cache_set(cache_key, feed_url, ttl)
+                        return items
+                    transient = transient or failed
+            if ttl:
+                # Only trust "no feed" for the full TTL if every path gave a
+                # definite answer; after 5xx/network errors, re-probe soon
+                cache_set(cache_key, b'', min(ttl, self._FEED_RETRY_TTL) if transient else ttl)
 
         # Try WordPress REST API
         wp_items = self._try_wp_api(base_url)
@@ -192,22 +332,36 @@ class NewsSiteScraper(BaseScraper):
 
     def _parse_rss_url(self, feed_url) -> List[DiscoveredItem]:
         """Try to fetch and parse an RSS/Atom feed URL. Returns items or empty list."""
+        return self._probe_feed(feed_url)[0]
+
+    def _probe_feed(self, feed_url):
+        """_parse_rss_url() that also reports whether the probe failed transiently.
+
+        Returns (items, transient); transient is True for 5xx responses and
+        network errors, where a later probe may well succeed.
+        """
         try:
-            resp = requests.get(feed_url, timeout=5, allow_redirects=True)
+            resp = HTTP.get(feed_url, timeout=5, allow_redirects=True)
             if resp.status_code != 200:
-                return []
+                return [], resp.status_code >= 500
 
-            content_type = resp.headers.get('Content-Type', '').lower()
-            is_feed = any(t in content_type for t in ['xml', 'rss', 'atom', 'feed'])
-            body_start = resp.text[:200].strip()
-            is_xml = body_start.startswith('<?xml') or body_start.startswith('<rss') or body_start.startswith('<feed')
+            # Sniff and parse the raw bytes; decoding the whole body to str
+            # first would just be re-encoded by feedparser
+            raw = resp.content
+            content_type = resp.headers.get('Content-Type', '')
+            content_type_lower = content_type.lower()
+            is_feed = any(t in content_type_lower for t in _FEED_CONTENT_TYPES)
+            is_xml = _FEED_BODY_RE.match(raw, 0, 200) is not None
 
             if not is_feed and not is_xml:
-                return []
+                return [], False
 
-            feed = feedparser.parse(resp.text)
+            feed = feedparser.parse(raw, response_headers={
+                'content-type': content_type,
+                'content-location': resp.url,
+            })
             if not feed.entries:
-                return []
+                return [], False
 
             logger.info(f"Found RSS feed at {feed_url} with {len(feed.entries)} entries")
             items = []
@@ -249,19 +403,19 @@ class NewsSiteScraper(BaseScraper):
                     metadata=metadata,
                 ))
 
-            return items
+            return items, False
 
         except requests.RequestException:
-            return []
+            return [], True
         except Exception as e:
             logger.debug(f"Feed probe failed for {feed_url}: {e}")
-            return []
+            return [], False
 
     def _try_wp_api(self, base_url) -> List[DiscoveredItem]:
         """Try the WordPress REST API to fetch recent posts."""
         api_url = base_url + self._WP_API_PATH
         try:
-            resp = requests.get(api_url, timeout=5, allow_redirects=True)
+            resp = HTTP.get(api_url, timeout=5, allow_redirects=True)
             if resp.status_code != 200:
                 return []
 
@@ -269,7 +423,7 @@ class NewsSiteScraper(BaseScraper):
             if 'json' not in content_type:
                 return []
 
-            posts = resp.json()
+            posts = orjson.loads(resp.content)
             if not isinstance(posts, list) or not posts:
                 return []
 
@@ -304,9 +458,8 @@ class NewsSiteScraper(BaseScraper):
                     snippet = excerpt_obj
 
                 # Strip HTML tags from title and snippet
-                import re as _re
-                title = _re.sub(r'<[^>]+>', '', title).strip()
-                snippet = _re.sub(r'<[^>]+>', '', snippet).strip()
+                title = _HTML_TAG_RE.sub('', title).strip()
+                snippet = _HTML_TAG_RE.sub('', snippet).strip()
 
                 # Full content from WP API (free enrichment)
                 metadata = {'content_source': 'wp_api'}
@@ -338,25 +491,28 @@ class NewsSiteScraper(BaseScraper):
         if source.keywords:
             payload['search'] = source.keywords
 
-        data = self._firecrawl_request('map', payload)
+        data = self._firecrawl_request('map', payload, cached=True)
         if data is None:
             logger.error(f"Firecrawl /map failed for {source.url}")
             return []
 
+        # /map has returned both bare URL strings and {url, title, description}
+        # objects, so the shape is checked per link; /map caps results at 50
         items = []
         for link_data in data.get('links', []):
             if isinstance(link_data, str):
-                items.append(DiscoveredItem(url=link_data))
-            elif isinstance(link_data, dict):
+                if link_data:
+                    items.append(DiscoveredItem(url=link_data))
+            elif isinstance(link_data, dict) and link_data.get('url'):
                 items.append(DiscoveredItem(
-                    url=link_data.get('url', ''),
+                    url=link_data['url'],
                     title=link_data.get('title'),
                     snippet=link_data.get('description'),
                 ))
-        return [i for i in items if i.url]
+        return items
 
     def _scrape_links_fallback(self, source) -> List[DiscoveredItem]:
-        data = self._firecrawl_request('scrape', {'url': source.url, 'formats': ['links']})
+        data = self._firecrawl_request('scrape', {'url': source.url, 'formats': ['links']}, cached=True)
         if data is None:
             logger.error(f"Firecrawl /scrape fallback failed for {source.url}")
             return []
@@ -418,7 +574,7 @@ class KeywordSearchScraper(BaseScraper):
                 },
             ))
 
-        return [i for i in items if i.url]
+        return self._dedupe([i for i in items if i.url])
 
 
 class YouTubeSearchScraper(BaseScraper):
@@ -498,11 +654,28 @@ class CompetitorScraper(NewsSiteScraper):
         return items
 
 
+@lru_cache(maxsize=256)
+def _json_path_parts(path: str) -> tuple:
+    """Split a DataScraper JSON path into ('key' | 'iter', name) steps."""
+    return tuple(
+        ('iter', segment[:-2]) if segment.endswith('[]') else ('key', segment)
+        for segment in path.split('.')
+    )
+
+
+# Report PDFs over this size are skipped; sources can set max_pdf_bytes
+DEFAULT_MAX_PDF_BYTES = 50 * 1024 * 1024
+
+
 class DataScraper(BaseScraper):
     """Scrape government PDF reports, extract text, and use Claude to identify story angles."""
 
     REQUIRED_CONFIG_FIELDS = {'discovery_mode', 'document_type', 'report_name', 'publisher', 'cadence', 'analysis_prompt'}
 
+    # Report text sent to Claude is cut at this many characters, so
+    # extraction stops reading pages once it has more than this
+    MAX_ANALYSIS_CHARS = 150000
+
     def scrape(self, source) -> List[DiscoveredItem]:
         config = source.config
         if not config or not self._validate_config(config):
@@ -519,22 +692,20 @@ class DataScraper(BaseScraper):
             logger.info(f"DataScraper: no report URLs discovered for source '{source.name}'")
             return []
 
+        # Download, extraction and analysis are independent per report, so run
+        # them concurrently; item building and the config write stay here on
+        # the calling thread, in report order.
+        with ThreadPoolExecutor(max_workers=min(4, len(report_urls))) as pool:
+            results = list(pool.map(
+                lambda report_info: self._process_report(report_info, config, api_key),
+                report_urls,
+            ))
+
         all_items = []
-        for report_info in report_urls:
+        for report_info, analysis in zip(report_urls, results):
+            if not analysis:
+                continue
             try:
-                pdf_bytes = self._download_pdf(report_info['url'])
-                if not pdf_bytes:
-                    continue
-
-                text = self._extract_text(pdf_bytes)
-                if not text or len(text.strip()) < 100:
-                    logger.warning(f"DataScraper: insufficient text extracted from {report_info['url']}")
-                    continue
-
-                analysis = self._analyze_with_claude(text, config, api_key)
-                if not analysis:
-                    continue
-
                 items = self._parse_angles_to_items(
                     analysis=analysis,
                     pdf_url=report_info['url'],
@@ -552,6 +723,30 @@ class DataScraper(BaseScraper):
 
         return all_items
 
+    def _process_report(self, report_info: dict, config: dict, api_key: str) -> Optional[dict]:
+        """Download, extract and analyze one report; returns the analysis or None."""
+        pdf_path = None
+        try:
+            pdf_path = self._download_pdf(
+                report_info['url'], config.get('max_pdf_bytes', DEFAULT_MAX_PDF_BYTES),
+            )
+            if not pdf_path:
+                return None
+
+            text = self._extract_text(pdf_path, use_pdfplumber=config.get('use_pdfplumber', False))
+            if not text or len(text.strip()) < 100:
+                logger.warning(f"DataScraper: insufficient text extracted from {report_info['url']}")
+                return None
+
+            return self._analyze_with_claude(text, config, api_key)
+
+        except Exception as e:
+            logger.error(f"DataScraper: error processing {report_info['url']}: {e}", exc_info=True)
+            return None
+        finally:
+            if pdf_path:
+                os.unlink(pdf_path)
+
     def _validate_config(self, config: dict) -> bool:
         missing = self.REQUIRED_CONFIG_FIELDS - set(config.keys())
         if missing:
@@ -594,31 +789,40 @@ class DataScraper(BaseScraper):
         pattern = config['url_pattern']
         lookback = config.get('lookback_months', 2)
         now = datetime.utcnow()
-        urls = []
 
+        targets = []
         for months_back in range(lookback):
             target_date = now - relativedelta(months=months_back)
             mmyy = target_date.strftime('%m%y')
-            url = pattern.replace('{MMYY}', mmyy)
+            targets.append((pattern.replace('{MMYY}', mmyy), target_date.strftime('%Y-%m')))
+        if not targets:
+            return []
 
-            try:
-                resp = requests.head(url, timeout=10, allow_redirects=True)
-                if resp.status_code == 200:
-                    content_type = resp.headers.get('Content-Type', '')
-                    if 'pdf' in content_type.lower() or url.lower().endswith('.pdf'):
-                        urls.append({
-                            'url': url,
-                            'date': target_date.strftime('%Y-%m'),
-                        })
-                        logger.info(f"DataScraper: found report at {url}")
-                    else:
-                        logger.debug(f"DataScraper: {url} returned 200 but Content-Type is '{content_type}'")
-                else:
-                    logger.debug(f"DataScraper: HEAD {url} returned {resp.status_code}")
-            except requests.RequestException as e:
-                logger.debug(f"DataScraper: HEAD check failed for {url}: {e}")
+        # Probe all months at once; the HEADs are independent network waits
+        with ThreadPoolExecutor(max_workers=min(12, len(targets))) as pool:
+            found = list(pool.map(self._probe_report_url, [url for url, _ in targets]))
 
-        return urls
+        return [
+            {'url': url, 'date': date}
+            for (url, date), ok in zip(targets, found) if ok
+        ]
+
+    @staticmethod
+    def _probe_report_url(url: str) -> bool:
+        """HEAD a candidate report URL; True if it serves a PDF."""
+        try:
+            resp = HTTP.head(url, timeout=10, allow_redirects=True)
+            if resp.status_code == 200:
+                content_type = resp.headers.get('Content-Type', '')
+                if 'pdf' in content_type.lower() or url.lower().endswith('.pdf'):
+                    logger.info(f"DataScraper: found report at {url}")
+                    return True
+                logger.debug(f"DataScraper: {url} returned 200 but Content-Type is '{content_type}'")
+            else:
+                logger.debug(f"DataScraper: HEAD {url} returned {resp.status_code}")
+        except requests.RequestException as e:
+            logger.debug(f"DataScraper: HEAD check failed for {url}: {e}")
+        return False
 
     def _discover_via_landing_page(self, source) -> List[dict]:
         config = source.config
@@ -631,7 +835,9 @@ class DataScraper(BaseScraper):
             logger.warning("FIRECRAWL_API_KEY not configured, cannot scrape landing page for PDFs")
             return []
 
-        data = self._firecrawl_request('scrape', {'url': landing_url, 'formats': ['links']}, timeout=30)
+        data = self._firecrawl_request(
+            'scrape', {'url': landing_url, 'formats': ['links']}, timeout=30, cached=True,
+        )
         if data is None:
             logger.error(f"DataScraper: Firecrawl scrape failed for {landing_url}")
             return []
@@ -653,33 +859,19 @@ class DataScraper(BaseScraper):
           - 'field[].child'   → [item['child'] for item in data['field']]
           - 'a.b[].c.d'      → nested traversal
         """
-        parts = []
-        for segment in path.split('.'):
-            if segment.endswith('[]'):
-                parts.append(('iter', segment[:-2]))
-            else:
-                parts.append(('key', segment))
-
-        def _walk(obj, remaining_parts):
-            if not remaining_parts:
-                return [obj] if obj is not None else []
-
-            kind, key = remaining_parts[0]
-            rest = remaining_parts[1:]
-
-            if kind == 'iter':
-                collection = obj.get(key, []) if isinstance(obj, dict) else []
-                results = []
-                for item in collection:
-                    results.extend(_walk(item, rest))
-                return results
-            else:
-                child = obj.get(key) if isinstance(obj, dict) else None
-                if child is None:
-                    return []
-                return _walk(child, rest)
+        frontier = [data]
+        for kind, key in _json_path_parts(path):
+            next_frontier = []
+            for obj in frontier:
+                if kind == 'iter':
+                    next_frontier.extend(obj.get(key, []) if isinstance(obj, dict) else [])
+                else:
+                    child = obj.get(key) if isinstance(obj, dict) else None
+                    if child is not None:
+                        next_frontier.append(child)
+            frontier = next_frontier
 
-        return _walk(data, parts)
+        return [obj for obj in frontier if obj is not None]
 
     def _discover_via_api(self, config: dict) -> List[dict]:
         """Fetch a JSON API endpoint and extract PDF URLs using configured JSON paths."""
@@ -692,9 +884,9 @@ class DataScraper(BaseScraper):
         lookback = config.get('lookback_months', 2)
 
         try:
-            resp = requests.get(api_url, timeout=30)
+            resp = HTTP.get(api_url, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             logger.error(f"DataScraper: API request failed for {api_url}: {e}")
             return []
@@ -736,21 +928,84 @@ class DataScraper(BaseScraper):
 
         return urls
 
-    def _download_pdf(self, url: str) -> Optional[bytes]:
+    def _download_pdf(self, url: str, max_bytes: int = DEFAULT_MAX_PDF_BYTES) -> Optional[str]:
+        """Stream a PDF to a temp file and return its path; the caller removes it.
+
+        Gives up (returns None) once the declared or downloaded size passes
+        ``max_bytes``.
+        """
+        tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        too_large = False
         try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
-            return resp.content
+            with tmp, HTTP.get(url, timeout=60, stream=True) as resp:
+                resp.raise_for_status()
+                content_length = resp.headers.get('Content-Length', '')
+                if content_length.isdigit() and int(content_length) > max_bytes:
+                    too_large = True
+                else:
+                    written = 0
+                    for chunk in resp.iter_content(chunk_size=64 * 1024):
+                        written += len(chunk)
+                        if written > max_bytes:
+                            too_large = True
+                            break
+                        tmp.write(chunk)
+            if not too_large:
+                return tmp.name
+            logger.warning(f"DataScraper: PDF {url} is larger than {max_bytes} bytes, skipping")
         except requests.RequestException as e:
             logger.error(f"DataScraper: failed to download PDF {url}: {e}")
+        except OSError as e:
+            logger.error(f"DataScraper: failed to write PDF {url} to disk: {e}")
+        os.unlink(tmp.name)
+        return None
+
+    def _extract_text(self, pdf_path: str, use_pdfplumber: bool = False) -> str:
+        """Extract report text with PDFium, or pdfplumber when tables matter.
+
+        PDFium is much faster but flattens tables into plain text; sources
+        whose tables need to survive as rows set ``use_pdfplumber`` in their
+        config. pdfplumber is also the fallback if PDFium can't read the file.
+        """
+        if not use_pdfplumber:
+            text = self._extract_text_pdfium(pdf_path)
+            if text is not None:
+                return text
+        return self._extract_text_pdfplumber(pdf_path)
+
+    def _extract_text_pdfium(self, pdf_path: str) -> Optional[str]:
+        import pypdfium2 as pdfium
+
+        text_parts = []
+        length = 0
+        try:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if page_text:
+                        text_parts.append(page_text)
+                        length += len(page_text) + 2
+                        if length > self.MAX_ANALYSIS_CHARS:
+                            break
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.warning(f"DataScraper: PDFium extraction failed, falling back to pdfplumber: {e}")
             return None
 
-    def _extract_text(self, pdf_bytes: bytes) -> str:
+        return '\n\n'.join(text_parts)
+
+    def _extract_text_pdfplumber(self, pdf_path: str) -> str:
         import pdfplumber
 
         text_parts = []
+        length = 0
         try:
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            with pdfplumber.open(pdf_path) as pdf:
                 for page in pdf.pages:
                     # Extract tables first
                     tables = page.extract_tables()
@@ -759,11 +1014,16 @@ class DataScraper(BaseScraper):
                             if row:
                                 cells = [str(cell) if cell else '' for cell in row]
                                 text_parts.append(' | '.join(cells))
+                                length += len(text_parts[-1]) + 2
 
                     # Extract remaining text
                     page_text = page.extract_text()
                     if page_text:
                         text_parts.append(page_text)
+                        length += len(page_text) + 2
+
+                    if length > self.MAX_ANALYSIS_CHARS:
+                        break
         except Exception as e:
             logger.error(f"DataScraper: pdfplumber extraction failed: {e}")
             return ''
@@ -771,8 +1031,6 @@ class DataScraper(BaseScraper):
         return '\n\n'.join(text_parts)
 
     def _analyze_with_claude(self, text: str, config: dict, api_key: str) -> Optional[dict]:
-        import anthropic
-
         max_angles = config.get('max_angles', 5)
         model = config.get('claude_model', 'claude-sonnet-4-20250514')
         analysis_prompt = config['analysis_prompt']
@@ -785,18 +1043,18 @@ class DataScraper(BaseScraper):
                 f"\n\n## Previous Report Data (for month-over-month comparison)\n"
                 f"Report date: {prev_data.get('report_date', 'unknown')}\n"
                 f"Summary: {prev_data.get('report_summary', 'N/A')}\n"
-                f"Key figures: {json.dumps(prev_data.get('key_figures', {}), indent=2)}\n"
+                f"Key figures: {orjson.dumps(prev_data.get('key_figures', {}), option=orjson.OPT_INDENT_2).decode()}\n"
             )
 
         # Truncate text to stay within reasonable token limits
-        max_chars = 150000
+        max_chars = self.MAX_ANALYSIS_CHARS
         if len(text) > max_chars:
             text = text[:max_chars] + "\n\n[... document truncated ...]"
 
-        user_message = (
-            f"{analysis_prompt}\n"
-            f"{previous_context}\n\n"
-            f"## Document Text\n\n{text}\n\n"
+        # The source's prompt and the response schema go in the system prompt,
+        # ahead of the per-report document.
+        instructions = (
+            f"{analysis_prompt}\n\n"
             f"## Response Instructions\n\n"
             f"Respond with valid JSON only (no markdown fencing). Use this exact structure:\n"
             f'{{\n'
@@ -815,27 +1073,33 @@ class DataScraper(BaseScraper):
             f'}}\n\n'
             f'Return up to {max_angles} story angles, ordered by significance.'
         )
+        user_message = (
+            f"{previous_context}\n\n"
+            f"## Document Text\n\n{text}\n\n"
+            f"Analyze the document above and respond with the JSON structure described."
+        ).lstrip()
 
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            response = client.messages.create(
+            client = anthropic_client(api_key)
+            # Streamed so a slow response over a ~150K-char prompt can't trip
+            # the non-streaming request timeout
+            with client.messages.stream(
                 model=model,
                 max_tokens=4096,
+                system=instructions,
                 messages=[{'role': 'user', 'content': user_message}],
-            )
+            ) as stream:
+                response = stream.get_final_message()
 
             response_text = response.content[0].text.strip()
             # Strip markdown code fencing if present
             if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                # Remove first line (```json or ```) and last line (```)
-                lines = [l for l in lines if not l.strip().startswith('```')]
-                response_text = '\n'.join(lines)
+                response_text = _CODE_FENCE_RE.sub('', response_text)
 
-            analysis = json.loads(response_text)
+            analysis = orjson.loads(response_text)
             return analysis
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"DataScraper: Claude returned invalid JSON: {e}")
             return None
         except Exception as e:
@@ -858,15 +1122,23 @@ class DataScraper(BaseScraper):
         if not pub_date:
             pub_date = datetime.utcnow()
 
-        for idx, angle in enumerate(angles, start=1):
-            # Create unique URL per angle using query param
+        # Create unique URL per angle using query param. Plain report URLs just
+        # get ?angle=N appended; others are parsed once and rebuilt per angle.
+        plain_url = '?' not in pdf_url and '#' not in pdf_url
+        if not plain_url:
             parsed = urlparse(pdf_url)
-            params = parse_qs(parsed.query)
-            params['angle'] = [str(idx)]
-            unique_url = urlunparse((
-                parsed.scheme, parsed.netloc, parsed.path,
-                parsed.params, urlencode(params, doseq=True), '',
-            ))
+            base_params = parse_qs(parsed.query)
+
+        for idx, angle in enumerate(angles, start=1):
+            if plain_url:
+                unique_url = f'{pdf_url}?angle={idx}'
+            else:
+                params = dict(base_params)
+                params['angle'] = [str(idx)]
+                unique_url = urlunparse((
+                    parsed.scheme, parsed.netloc, parsed.path,
+                    parsed.params, urlencode(params, doseq=True), '',
+                ))
 
             items.append(DiscoveredItem(
                 url=unique_url,
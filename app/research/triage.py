@@ -8,16 +8,26 @@ verdicts so the existing heuristic pipeline still runs.
 import json
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from flask import current_app
 
+from app.concurrency import run_in_app_context
+from app.http_client import anthropic_client
+
 logger = logging.getLogger(__name__)
 
 # Source types that skip triage (already curated or always relevant)
 _SKIP_TRIAGE_SOURCE_TYPES = {'Data', 'House Content'}
 
+# Concurrent page fetches per tool-use turn; Firecrawl's rate limiter
+# serializes anything past its burst of 3 anyway
+_FETCH_WORKERS = 4
+
 # Claude tool definition for page fetching
 _FETCH_PAGE_TOOL = {
     "name": "fetch_page",
@@ -70,44 +80,94 @@ def triage_items(items, source_types, industry_description, reader_personas):
         logger.warning("ANTHROPIC_API_KEY not configured, skipping triage")
         return [{'url': item.url, 'verdict': 'maybe', 'reasoning': 'triage skipped (no API key)'} for item in items]
 
-    model = current_app.config.get('TRIAGE_MODEL', 'claude-haiku-4-5-20251001')
-    batch_size = current_app.config.get('TRIAGE_MAX_BATCH_SIZE', 40)
-    fetch_budget = current_app.config.get('TRIAGE_FETCH_BUDGET', 5)
+    app = current_app._get_current_object()
+    model = app.config.get('TRIAGE_MODEL', 'claude-haiku-4-5-20251001')
+    batch_size = app.config.get('TRIAGE_MAX_BATCH_SIZE', 40)
+    token_budget = app.config.get('TRIAGE_TOKEN_BUDGET', 6000)
+    max_concurrency = app.config.get('TRIAGE_MAX_CONCURRENCY', 4)
+    budget = _FetchBudget(app.config.get('TRIAGE_FETCH_BUDGET', 5))
+
+    # Pack into batches by estimated prompt size. Batches are independent
+    # apart from the shared page-fetch budget, so they run concurrently;
+    # results keep input order.
+    batches = _pack_batches(items, source_types, token_budget, batch_size)
+    batch_args = [
+        (batch_items, batch_source_types, industry_description, reader_personas,
+         api_key, model, budget)
+        for batch_items, batch_source_types in batches
+    ]
+
+    if len(batches) == 1:
+        batch_outputs = [_triage_batch(*batch_args[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(batches)))) as pool:
+            batch_outputs = list(pool.map(
+                lambda args: run_in_app_context(app, _triage_batch, *args), batch_args
+            ))
 
-    # Split into batches
     results = []
     total_fetches = 0
-    api_calls = 0
-
-    for start in range(0, len(items), batch_size):
-        batch_items = items[start:start + batch_size]
-        batch_source_types = source_types[start:start + batch_size]
-        remaining_fetch_budget = max(0, fetch_budget - total_fetches)
-
-        batch_results, fetches = _triage_batch(
-            batch_items,
-            batch_source_types,
-            industry_description,
-            reader_personas,
-            api_key,
-            model,
-            remaining_fetch_budget,
-        )
+    for batch_results, fetches in batch_outputs:
         results.extend(batch_results)
         total_fetches += fetches
-        api_calls += 1
 
     logger.info(
         f"Triage complete: {len(results)} items, "
-        f"{api_calls} API calls, {total_fetches} page fetches"
+        f"{len(batches)} API calls, {total_fetches} page fetches"
     )
     return results
 
 
+def _estimate_item_tokens(item):
+    """Rough input-token cost of one item in the user message (~4 chars/token)."""
+    chars = len(item.url or '') + len(item.title or '') + min(len(item.snippet or ''), 300)
+    return chars // 4 + 30  # +30 for the JSON keys and source_type
+
+
+def _pack_batches(items, source_types, token_budget, max_batch_size):
+    """Split items into (items, source_types) batches.
+
+    A batch is flushed when the next item would push it over ``token_budget``
+    estimated tokens or it already holds ``max_batch_size`` items. An item
+    larger than the budget on its own still gets a batch.
+    """
+    batches = []
+    cur_items, cur_types, cur_tokens = [], [], 0
+    for item, st in zip(items, source_types):
+        est = _estimate_item_tokens(item)
+        if cur_items and (cur_tokens + est > token_budget or len(cur_items) >= max_batch_size):
+            batches.append((cur_items, cur_types))
+            cur_items, cur_types, cur_tokens = [], [], 0
+        cur_items.append(item)
+        cur_types.append(st)
+        cur_tokens += est
+    if cur_items:
+        batches.append((cur_items, cur_types))
+    return batches
+
+
+class _FetchBudget:
+    """Page-fetch allowance shared by concurrently running triage batches."""
+
+    def __init__(self, total):
+        self.total = total
+        self._remaining = total
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Claim one fetch; False once the run's budget is spent."""
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
 def _triage_batch(items, source_types, industry_description, reader_personas,
-                  api_key, model, fetch_budget):
+                  api_key, model, budget):
     """Triage a single batch via one Claude API call.
 
+    ``budget`` is the run's shared _FetchBudget.
     Returns (list[dict], int) — verdicts and number of page fetches used.
     """
     import anthropic
@@ -121,12 +181,12 @@ def _triage_batch(items, source_types, industry_description, reader_personas,
     user_message = _build_user_message(items, source_types)
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = anthropic_client(api_key)
         messages = [{'role': 'user', 'content': user_message}]
         fetches_used = 0
 
         # Conversation loop to handle tool use
-        for _ in range(fetch_budget + 2):  # +2: initial call + final no-tools call
+        for _ in range(budget.total + 2):  # +2: initial call + final no-tools call
             response = client.messages.create(
                 model=model,
                 max_tokens=4096,
@@ -137,20 +197,28 @@ def _triage_batch(items, source_types, industry_description, reader_personas,
 
             # Check if Claude wants to use a tool
             if response.stop_reason == 'tool_use':
+                # Claim budget for every fetch requested this turn, then fetch
+                # the claimed pages together rather than one after another
+                fetch_calls = [
+                    (block, budget.take())
+                    for block in response.content
+                    if block.type == 'tool_use' and block.name == 'fetch_page'
+                ]
+                pages = iter(_fetch_pages_for_triage(
+                    [block.input.get('url', '') for block, granted in fetch_calls if granted]
+                ))
                 tool_results = []
-                for block in response.content:
-                    if block.type == 'tool_use' and block.name == 'fetch_page':
-                        url = block.input.get('url', '')
-                        if fetches_used < fetch_budget:
-                            content = _fetch_page_for_triage(url)
-                            fetches_used += 1
-                        else:
-                            content = '[Fetch budget exceeded — classify based on available information]'
-                        tool_results.append({
-                            'type': 'tool_result',
-                            'tool_use_id': block.id,
-                            'content': content,
-                        })
+                for block, granted in fetch_calls:
+                    if granted:
+                        content = next(pages)
+                        fetches_used += 1
+                    else:
+                        content = '[Fetch budget exceeded — classify based on available information]'
+                    tool_results.append({
+                        'type': 'tool_result',
+                        'tool_use_id': block.id,
+                        'content': content,
+                    })
 
                 # Add assistant response and tool results to continue conversation
                 messages.append({'role': 'assistant', 'content': response.content})
@@ -187,7 +255,7 @@ def _triage_batch(items, source_types, industry_description, reader_personas,
         logger.warning("Triage API rate limited, retrying once after 10s")
         time.sleep(10)
         try:
-            client = anthropic.Anthropic(api_key=api_key)
+            client = anthropic_client(api_key)
             response = client.messages.create(
                 model=model,
                 max_tokens=4096,
@@ -205,6 +273,7 @@ def _triage_batch(items, source_types, industry_description, reader_personas,
         return fallback, 0
 
 
+@lru_cache(maxsize=8)
 def _build_system_prompt(industry_description, reader_personas):
     """Build the system prompt for the triage agent."""
     return (
@@ -338,6 +407,21 @@ def _parse_response(response, items):
     return results
 
 
+def _fetch_pages_for_triage(urls):
+    """Fetch several pages concurrently, returning contents in ``urls`` order.
+
+    Firecrawl calls still go through the shared rate limiter in enrichment.
+    """
+    if len(urls) <= 1:
+        return [_fetch_page_for_triage(url) for url in urls]
+
+    app = current_app._get_current_object()
+    with ThreadPoolExecutor(max_workers=min(len(urls), _FETCH_WORKERS)) as pool:
+        return list(pool.map(
+            lambda url: run_in_app_context(app, _fetch_page_for_triage, url), urls
+        ))
+
+
 def _fetch_page_for_triage(url: str) -> str:
     """Fetch a page via Firecrawl for triage classification.
 
@@ -1,14 +1,15 @@
 """Celery tasks for scheduled content generation and research."""
 import logging
-import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
+import orjson
 import requests
 from flask import current_app
 
 from app.celery import celery
+from app.cms import PUSH_MAX_RETRIES
 from app import db
-from app.models import Publication, WorkflowRun, CandidateArticle, NewsSource, ResearchLog, WeeklyBriefing, AuthorProfile
+from app.models import Publication, WorkflowRun, new_workflow_id, CandidateArticle, NewsSource, ResearchLog, WeeklyBriefing, AuthorProfile
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ def trigger_scheduled_content_workflow(publication_id):
         return {'error': 'N8N_CANDIDATE_CONTENT_WORKFLOW_URL not configured'}
 
     # Create workflow run record (triggered_by_id=None for system-triggered)
-    workflow_id = str(uuid.uuid4())
+    workflow_id = new_workflow_id()
     workflow_run = WorkflowRun(
         id=workflow_id,
         publication_id=publication.id,
@@ -109,6 +110,92 @@ def trigger_scheduled_content_workflow(publication_id):
         return result
 
 
+@celery.task(name='app.tasks.push_content_to_cms', bind=True, max_retries=PUSH_MAX_RETRIES)
+def push_content_to_cms(self, workflow_id, content_id, user_id, version_id=None):
+    """
+    Push an article, or one of its versions, to the publication's CMS.
+    Queued by the push routes; the outcome is recorded on the WorkflowRun
+    the UI polls.
+
+    Failures where the POST never reached the CMS (open circuit, connection
+    errors) are retried with exponential backoff (1s..32s, ~63s in all, so
+    the last tries land after the breaker's 60s reset). Anything after
+    delivery (read timeouts, error responses) fails immediately so the
+    article is never published twice; the user can re-push.
+    """
+    from app.cms import post_to_cms, build_cms_payload, cms_headers, CMSError, CMSUnavailableError
+    from app.models import NewsContent, ContentVersion, utc_now
+
+    workflow_run = WorkflowRun.query.get(workflow_id)
+    content = NewsContent.query.get(content_id)
+    version = ContentVersion.query.get(version_id) if version_id else None
+    if not workflow_run or not content or (version_id and not version):
+        return {'error': f'Nothing to push for workflow {workflow_id}'}
+
+    def finish(status, message):
+        workflow_run.status = status
+        workflow_run.message = message
+        workflow_run.completed_at = utc_now()
+        db.session.commit()
+        return {'status': status, 'message': message, 'workflow_id': workflow_id}
+
+    # Legacy content tracks the push on itself; versions track their own
+    target = version or content
+    if target.pushed_to_cms:
+        return finish('completed', 'Already pushed to CMS')
+
+    publication = content.publication
+    workflow_run.status = 'running'
+    db.session.commit()
+
+    payload = build_cms_payload(
+        content.title,
+        target.content,
+        deck=target.deck,
+        teaser=target.teaser,
+    )
+
+    try:
+        response, body = post_to_cms(publication.cms_url, payload, cms_headers(publication))
+
+        # Record the actual API error message so it shows in the UI
+        if not response.ok:
+            try:
+                error_detail = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                error_detail = body.decode('utf-8', errors='replace')
+            error_msg = f'CMS API error ({response.status_code}): {error_detail}'
+            logger.error(f'CMS push failed: {error_msg}')
+            logger.error(f'Payload sent: {payload}')
+            return finish('failed', error_msg)
+
+        cms_response = orjson.loads(body)
+        target.pushed_to_cms = True
+        target.cms_id = cms_response.get('id')
+        target.pushed_at = utc_now()
+        target.pushed_by_id = user_id
+        content.status = 'published'
+
+        if version:
+            message = f'{version.ai_provider.title()} version pushed to CMS successfully'
+        else:
+            message = 'Content pushed to CMS successfully'
+        return finish('completed', message)
+
+    except (CMSUnavailableError, requests.exceptions.ConnectionError) as e:
+        if self.request.retries < self.max_retries:
+            countdown = 2 ** self.request.retries
+            logger.warning(f'CMS push {workflow_id} failed ({e}), retrying in {countdown}s')
+            raise self.retry(exc=e, countdown=countdown)
+        return finish('failed', f'Failed to push to CMS: {str(e)}')
+    except (CMSError, requests.exceptions.RequestException) as e:
+        return finish('failed', f'Failed to push to CMS: {str(e)}')
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f'CMS push {workflow_id} failed: {e}', exc_info=True)
+        return finish('failed', f'An error occurred: {str(e)}')
+
+
 @celery.task(name='app.tasks.check_publication_schedules')
 def check_publication_schedules():
     """
@@ -315,9 +402,10 @@ def research_publication_sources(self, publication_id):
     deduplicate, triage via LLM, score, enrich, and store them.
     """
     from app.research.scrapers import get_scraper
-    from app.research.dedup import url_hash, is_duplicate_candidate, is_already_content, sanitize_url
+    from app.research.dedup import url_hash, bulk_existing_hashes, sanitize_url
+    from app.research.candidates import persist_candidates
     from app.research.scoring import score_candidate, compute_recency_score
-    from app.research.enrichment import enrich_item, _extract_date_from_url
+    from app.research.enrichment import enrich_items_parallel, _extract_date_from_url
     from app.research.triage import triage_items, TRIAGE_MULTIPLIERS, _SKIP_TRIAGE_SOURCE_TYPES
 
     publication = Publication.query.get(publication_id)
@@ -367,10 +455,14 @@ def research_publication_sources(self, publication_id):
         'errors': 0,
     }
 
+    # One reference time for the whole run, so date bounds stay consistent
+    run_now = datetime.now(timezone.utc)
+
     # ── Phase 1: Discover + Dedup ──────────────────────────────────
     # Collect all non-duplicate items across all sources before triage.
     pending_items = []  # list of (DiscoveredItem, source, url_hash) tuples
     seen_hashes = set()  # in-memory dedup within this run
+    scraped = []  # (scraper, source) pairs whose state is saved with the candidates
 
     for source in sources:
         scraper = get_scraper(source.source_type)
@@ -380,6 +472,7 @@ def research_publication_sources(self, publication_id):
 
         try:
             items = scraper.scrape(source)
+            scraped.append((scraper, source))
             stats['sources_scanned'] += 1
             stats['total_discovered'] += len(items)
         except Exception as e:
@@ -390,21 +483,28 @@ def research_publication_sources(self, publication_id):
             stats['errors'] += 1
             continue
 
+        # Hash everything up front so known URLs are found in one batched lookup
+        hashed_items = []
         for item in items:
             try:
                 item.url = sanitize_url(item.url)
-                hash_val = url_hash(item.url)
+                hashed_items.append((item, url_hash(item.url)))
+            except Exception as e:
+                logger.error(f"Error deduping item {item.url}: {e}")
+                _research_log(publication_id, 'dedup', 'error',
+                              f"Dedup failed: {e}", source_id=source.id, url=item.url)
+                stats['errors'] += 1
+        existing_hashes = bulk_existing_hashes([h for _, h in hashed_items], publication_id)
 
+        for item, hash_val in hashed_items:
+            try:
                 # In-memory dedup: skip if another source already found this URL
                 if hash_val in seen_hashes:
                     stats['skipped_duplicates'] += 1
                     continue
 
-                if is_duplicate_candidate(hash_val, publication_id):
-                    stats['skipped_duplicates'] += 1
-                    continue
-
-                if is_already_content(item.url, publication_id):
+                # Already a candidate or generated content for this publication
+                if hash_val in existing_hashes:
                     stats['skipped_duplicates'] += 1
                     continue
 
@@ -419,13 +519,12 @@ def research_publication_sources(self, publication_id):
                 # Check the scraper-provided date first, then URL date pattern
                 item_date = item.published_date
                 if not item_date:
-                    item_date = _extract_date_from_url(item.url)
+                    item_date = _extract_date_from_url(item.url, run_now)
                 if item_date:
                     if item_date.tzinfo is None:
-                        age_days = (datetime.utcnow() - item_date).days
+                        age_days = (run_now.replace(tzinfo=None) - item_date).days
                     else:
-                        from datetime import timezone
-                        age_days = (datetime.now(timezone.utc) - item_date).days
+                        age_days = (run_now - item_date).days
                     if age_days > 90:
                         stats['skipped_excluded'] += 1
                         continue
@@ -474,7 +573,14 @@ def research_publication_sources(self, publication_id):
                 elif v['verdict'] == 'not_news':
                     stats['triage_rejected'] += 1
 
-    # ── Phase 3: Score + Enrich + Save ─────────────────────────────
+    # ── Phase 3: Score ─────────────────────────────────────────────
+    # Score everything first and decide which items to enrich, so the
+    # network-bound enrichment calls can run as one concurrent batch.
+    scored_items = []  # list of (item, source, hash_val, verdict_info, scores, enrich_index)
+    candidate_rows = []  # CandidateArticle column dicts, bulk-inserted at the end
+    enrich_jobs = []  # list of (url, metadata, source_type, source_url) tuples
+    firecrawl_calls = 0
+
     for item, source, hash_val in pending_items:
         try:
             verdict_info = verdict_map.get(item.url, {})
@@ -487,7 +593,7 @@ def research_publication_sources(self, publication_id):
                 reject_metadata['triage_verdict'] = verdict
                 reject_metadata['triage_reasoning'] = reasoning
 
-                candidate = CandidateArticle(
+                candidate_rows.append(dict(
                     publication_id=publication_id,
                     news_source_id=source.id,
                     url=item.url,
@@ -502,8 +608,7 @@ def research_publication_sources(self, publication_id):
                     source_weight=0,
                     status='rejected',
                     extra_metadata=reject_metadata,
-                )
-                db.session.add(candidate)
+                ))
                 stats['new_candidates'] += 1
                 continue
 
@@ -523,20 +628,52 @@ def research_publication_sources(self, publication_id):
                 scores['relevance_score'] = round(scores['relevance_score'] * multiplier, 2)
 
             # Enrich candidates above the score threshold
-            enriched_metadata = item.metadata or {}
+            metadata = item.metadata or {}
             wants_enrichment = (
                 scores['relevance_score'] >= enrichment_min_score
                 and source.source_type != 'Data'
             )
             # RSS and YouTube enrichment is free; only Firecrawl costs budget
             is_free_enrichment = (
-                'rss_full_content' in enriched_metadata
+                'rss_full_content' in metadata
                 or source.source_type == 'YouTube Keywords'
             )
-            firecrawl_calls = stats['enriched'] + stats['enrichment_failed'] - stats.get('_free_enrichments', 0)
 
+            enrich_index = None
             if wants_enrichment and (is_free_enrichment or firecrawl_calls < enrichment_budget):
-                enriched_metadata = enrich_item(item.url, enriched_metadata, source.source_type, source_url=source.url)
+                if not is_free_enrichment:
+                    firecrawl_calls += 1
+                enrich_index = len(enrich_jobs)
+                enrich_jobs.append((item.url, metadata, source.source_type, source.url))
+            elif wants_enrichment:
+                stats['enrichment_budget_exhausted'] += 1
+                stats['enrichment_skipped'] += 1
+            else:
+                stats['enrichment_skipped'] += 1
+
+            scored_items.append((item, source, hash_val, verdict_info, scores, enrich_index))
+
+        except Exception as e:
+            logger.error(f"Error processing item {item.url}: {e}")
+            _research_log(publication_id, 'scoring', 'error',
+                          f"Processing failed: {e}", source_id=source.id, url=item.url,
+                          details={'exception': str(e)})
+            stats['errors'] += 1
+            continue
+
+    # ── Phase 4: Enrich ────────────────────────────────────────────
+    enriched_results = enrich_items_parallel(enrich_jobs, now=run_now)
+
+    # ── Phase 5: Save ──────────────────────────────────────────────
+    for item, source, hash_val, verdict_info, scores, enrich_index in scored_items:
+        try:
+            verdict = verdict_info.get('verdict')
+            reasoning = verdict_info.get('reasoning', '')
+
+            if enrich_index is None:
+                enriched_metadata = item.metadata or {}
+            else:
+                enriched_metadata = enriched_results[enrich_index]
                 if enriched_metadata.get('enrichment_failed'):
                     stats['enrichment_failed'] += 1
                     _research_log(publication_id, 'enrichment', 'warning',
@@ -544,13 +681,6 @@ def research_publication_sources(self, publication_id):
                                   details={'reason': enriched_metadata.get('enrichment_error')})
                 else:
                     stats['enriched'] += 1
-                    if is_free_enrichment:
-                        stats['_free_enrichments'] = stats.get('_free_enrichments', 0) + 1
-            elif wants_enrichment:
-                stats['enrichment_budget_exhausted'] += 1
-                stats['enrichment_skipped'] += 1
-            else:
-                stats['enrichment_skipped'] += 1
 
             # Try to fill in missing publish dates and rescore
             published_date = item.published_date
@@ -568,7 +698,7 @@ def research_publication_sources(self, publication_id):
                         pass
                 # Fall back to URL pattern
                 if not published_date:
-                    published_date = _extract_date_from_url(item.url)
+                    published_date = _extract_date_from_url(item.url, run_now)
 
                 if published_date:
                     new_recency = compute_recency_score(published_date)
@@ -588,7 +718,7 @@ def research_publication_sources(self, publication_id):
                 enriched_metadata['triage_verdict'] = verdict
                 enriched_metadata['triage_reasoning'] = reasoning
 
-            candidate = CandidateArticle(
+            candidate_rows.append(dict(
                 publication_id=publication_id,
                 news_source_id=source.id,
                 url=item.url,
@@ -603,8 +733,7 @@ def research_publication_sources(self, publication_id):
                 source_weight=scores['source_weight'],
                 status='new',
                 extra_metadata=enriched_metadata,
-            )
-            db.session.add(candidate)
+            ))
             stats['new_candidates'] += 1
 
         except Exception as e:
@@ -619,6 +748,8 @@ def research_publication_sources(self, publication_id):
     # Use flush-first approach so IntegrityErrors (e.g. duplicate url_hash
     # from two sources finding the same URL) don't kill the whole batch.
     try:
+        persist_candidates(candidate_rows)
+        _apply_source_state(scraped)
         publication.last_research_run = datetime.utcnow()
         db.session.flush()
         db.session.commit()
@@ -632,8 +763,10 @@ def research_publication_sources(self, publication_id):
         publication = Publication.query.get(publication_id)
         publication.last_research_run = datetime.utcnow()
         saved = 0
+        # Whatever collided is in the table now; look it up in one query
+        existing_hashes = bulk_existing_hashes([h for _, _, h in pending_items], publication_id)
         for item, source, hash_val in pending_items:
-            if is_duplicate_candidate(hash_val, publication_id):
+            if hash_val in existing_hashes:
                 continue
             try:
                 # Re-check for triage verdict
@@ -672,6 +805,7 @@ def research_publication_sources(self, publication_id):
                 publication.last_research_run = datetime.utcnow()
                 continue
         try:
+            _apply_source_state(scraped)
             db.session.commit()
             logger.info(f"One-by-one fallback saved {saved} candidates for pub {publication_id}")
         except Exception as e2:
@@ -681,7 +815,6 @@ def research_publication_sources(self, publication_id):
                           f"Fallback commit also failed: {e2}")
             raise self.retry(exc=e2)
 
-    stats.pop('_free_enrichments', None)
     logger.info(f"Research complete for publication {publication_id}: {stats}")
     _research_log(publication_id, 'discovery', 'info',
                   f"Research run complete: {stats['new_candidates']} new, "
@@ -695,6 +828,15 @@ def research_publication_sources(self, publication_id):
     return stats
 
 
+def _apply_source_state(scraped):
+    """Stage per-source scraper state (e.g. RSS validators) for the pending commit."""
+    for scraper, source in scraped:
+        try:
+            scraper.apply_source_state(source)
+        except Exception as e:
+            logger.error(f"Failed to update scraper state for source {source.id}: {e}")
+
+
 @celery.task(name='app.tasks.retriage_source_candidates')
 def retriage_source_candidates(source_id):
     """Re-run LLM triage on rejected candidates for a source using current publication settings."""
@@ -822,7 +964,7 @@ def generate_weekly_briefings(publication_id=None):
     If publication_id is provided, generates for that publication only.
     Otherwise generates for all active publications.
     """
-    import anthropic
+    from app.http_client import anthropic_client
     import json
 
     api_key = current_app.config.get('ANTHROPIC_API_KEY')
@@ -884,7 +1026,7 @@ def generate_weekly_briefings(publication_id=None):
         )
 
         try:
-            client = anthropic.Anthropic(api_key=api_key)
+            client = anthropic_client(api_key)
             response = client.messages.create(
                 model=model,
                 max_tokens=1024,
@@ -923,7 +1065,7 @@ def generate_weekly_briefings(publication_id=None):
 @celery.task(name='app.tasks.generate_author_style_guide')
 def generate_author_style_guide(author_profile_id):
     """Analyze sample articles and generate a writing style guide for an author profile."""
-    import anthropic
+    from app.http_client import anthropic_client
 
     profile = AuthorProfile.query.get(author_profile_id)
     if not profile:
@@ -982,7 +1124,7 @@ def generate_author_style_guide(author_profile_id):
 
     try:
         model = current_app.config.get('STYLE_GUIDE_MODEL', 'claude-haiku-4-5-20251001')
-        client = anthropic.Anthropic(api_key=api_key)
+        client = anthropic_client(api_key)
         response = client.messages.create(
             model=model,
             max_tokens=2048,
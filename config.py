@@ -24,6 +24,11 @@ class Config:
 
     # Research / Scraping
     FIRECRAWL_API_KEY = os.environ.get('FIRECRAWL_API_KEY')
+    FIRECRAWL_MAX_RESPONSE_BYTES = int(os.environ.get('FIRECRAWL_MAX_RESPONSE_BYTES', 2 * 1024 * 1024))
+    # Seconds to reuse identical /map and link-scrape responses (0 disables)
+    FIRECRAWL_CACHE_TTL = int(os.environ.get('FIRECRAWL_CACHE_TTL', 900))
+    # Seconds to remember which feed path (if any) a news site serves (0 disables)
+    FEED_DISCOVERY_CACHE_TTL = int(os.environ.get('FEED_DISCOVERY_CACHE_TTL', 6 * 3600))
     SERPAPI_API_KEY = os.environ.get('SERPAPI_API_KEY')
     ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 
@@ -42,15 +47,22 @@ class Config:
     CELERY_BROKER_URL = _redis_url
     CELERY_RESULT_BACKEND = _redis_url
 
+    # Response caching (shares the Celery Redis instance)
+    REDIS_URL = _redis_url
+    RECENT_ARTICLES_CACHE_TTL = int(os.environ.get('RECENT_ARTICLES_CACHE_TTL', 30))
+
     # Enrichment
     ENRICHMENT_MIN_SCORE = float(os.environ.get('ENRICHMENT_MIN_SCORE', 25.0))
     ENRICHMENT_MAX_PER_RUN = int(os.environ.get('ENRICHMENT_MAX_PER_RUN', 50))
+    ENRICH_WORKERS = int(os.environ.get('ENRICH_WORKERS', 4))
 
     # LLM Triage
     TRIAGE_ENABLED = os.environ.get('TRIAGE_ENABLED', 'true').lower() == 'true'
     TRIAGE_MODEL = os.environ.get('TRIAGE_MODEL', 'claude-haiku-4-5-20251001')
     TRIAGE_MAX_BATCH_SIZE = int(os.environ.get('TRIAGE_MAX_BATCH_SIZE', 40))
+    TRIAGE_TOKEN_BUDGET = int(os.environ.get('TRIAGE_TOKEN_BUDGET', 6000))
     TRIAGE_FETCH_BUDGET = int(os.environ.get('TRIAGE_FETCH_BUDGET', 5))
+    TRIAGE_MAX_CONCURRENCY = int(os.environ.get('TRIAGE_MAX_CONCURRENCY', 4))
 
     # Mailgun email notifications
     MAILGUN_API_KEY = os.environ.get('MAILGUN_API_KEY')
@@ -0,0 +1,26 @@
+"""Add composite index for dashboard keyset pagination
+
+Revision ID: 3f9a1c7d2b64
+Revises: 728d6d9668d6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7d2b64'
+down_revision = '728d6d9668d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.create_index('ix_news_content_pub_status_created_id', ['publication_id', 'status', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.drop_index('ix_news_content_pub_status_created_id')
@@ -0,0 +1,26 @@
+"""Add publication/created_at index for the unfiltered dashboard view
+
+Revision ID: 8c2e4d1a9f37
+Revises: 3f9a1c7d2b64
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e4d1a9f37'
+down_revision = '3f9a1c7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.create_index('ix_news_content_pub_created_id', ['publication_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.drop_index('ix_news_content_pub_created_id')
@@ -0,0 +1,49 @@
+"""Compute timestamp defaults in the database
+
+Revision ID: b7d3e5f1a2c8
+Revises: 8c2e4d1a9f37
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3e5f1a2c8'
+down_revision = '8c2e4d1a9f37'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = {
+    'user': ['created_at'],
+    'publication': ['created_at'],
+    'news_source': ['created_at', 'updated_at'],
+    'research_log': ['created_at'],
+    'author_profile': ['created_at', 'updated_at'],
+    'weekly_briefing': ['created_at'],
+    'news_content': ['created_at', 'updated_at'],
+    'content_version': ['created_at'],
+    'workflow_run': ['created_at'],
+    'version_audit': ['created_at'],
+    'patched_version': ['created_at'],
+    'candidate_article': ['discovered_at', 'updated_at'],
+    'newsletter_template': ['created_at'],
+    'newsletter': ['created_at', 'updated_at'],
+}
+
+
+def upgrade():
+    # UTC regardless of the session timezone; the columns are naive
+    utc_now = sa.text("timezone('utc', now())")
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=utc_now)
+
+
+def downgrade():
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=None)
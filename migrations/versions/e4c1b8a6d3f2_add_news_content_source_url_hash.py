@@ -0,0 +1,80 @@
+"""Add source_url_hash to news_content for indexed dedup lookups
+
+Revision ID: e4c1b8a6d3f2
+Revises: b7d3e5f1a2c8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+import hashlib
+import re
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4c1b8a6d3f2'
+down_revision = 'b7d3e5f1a2c8'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of app.research.dedup.url_hash as of this revision, so later
+# changes to the live normalization can't change what this migration writes.
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'ref', 'mc_cid', 'mc_eid',
+})
+_SINGLE_SLASH_SCHEME_RE = re.compile(r'^(https?):/?([^/])')
+
+
+def _url_hash(url):
+    url = _SINGLE_SLASH_SCHEME_RE.sub(r'\1://\2', url)
+    parsed = urlparse(url)
+    if parsed.netloc and parsed.path.startswith('/' + parsed.netloc):
+        fixed_path = parsed.path[len(parsed.netloc) + 1:]
+        parsed = urlparse(urlunparse((parsed.scheme, parsed.netloc, fixed_path,
+                                      parsed.params, parsed.query, parsed.fragment)))
+
+    query = ''
+    if parsed.query:
+        query_params = parse_qs(parsed.query, keep_blank_values=True)
+        query = urlencode(
+            [(k, v) for k, v in query_params.items() if k.lower() not in _TRACKING_PARAMS],
+            doseq=True,
+        )
+    normalized = urlunparse((parsed.scheme.lower(), parsed.netloc.lower(),
+                             parsed.path.rstrip('/'), parsed.params, query, ''))
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def upgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('source_url_hash', sa.String(length=64), nullable=True))
+
+    # Backfill in id-ordered chunks so the table is never held in memory
+    conn = op.get_bind()
+    select = sa.text(
+        "SELECT id, source_url FROM news_content "
+        "WHERE id > :last_id AND source_url IS NOT NULL AND source_url <> '' "
+        "ORDER BY id LIMIT :limit"
+    )
+    update = sa.text("UPDATE news_content SET source_url_hash = :hash WHERE id = :id")
+    last_id = 0
+    while True:
+        rows = conn.execute(select, {'last_id': last_id, 'limit': BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        conn.execute(update, [{'id': row.id, 'hash': _url_hash(row.source_url)} for row in rows])
+        last_id = rows[-1].id
+
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_news_content_source_url_hash'), ['source_url_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('news_content', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_news_content_source_url_hash'))
+        batch_op.drop_column('source_url_hash')